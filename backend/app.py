@@ -1,19 +1,30 @@
 from flask import Flask, request, jsonify
 from flask_cors import CORS
-import spacy
-import sqlite3
 import os
 from dotenv import load_dotenv
-import requests
 import urllib.parse
-from flask_bcrypt import Bcrypt
 from flask_jwt_extended import create_access_token, jwt_required, get_jwt_identity, JWTManager
 import sqlalchemy # Ensure this is imported
 import time
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+import hmac
+import concurrent.futures
 load_dotenv()
+from db import get_db_connection, get_pool_stats
+from query_log import get_query_stats
+from catalogue_meta import on_catalogue_change
+from catalogue_snapshot import get_snapshot
+from embeddings import is_available as semantic_search_available, normalize as normalize_vector
+from nlp_model import load_model, process, has_static_vectors, get_nlp_stats
+from cache import LRUCache
+from geoapify import GEOAPIFY_API_KEY, get_http_stats
+from venue_cache import get_cached_venues, get_venue_cache_stats, tile_for
+from passwords import PasswordHasherBusy, hash_password, check_password, needs_rehash, record_rehash, get_password_stats
+from instrumentation import ENABLED as METRICS_ENABLED, bind, instrument_app, render_prometheus
+from request_profiler import PROFILE_HEADER, attach_profiler, is_authorized as profiler_authorized, read_profile, get_profiler_stats
+from serialization import FastJSONProvider, stream_json_array
+from reviews import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, RATINGS, fetch_review_page, fetch_review_summaries, record_review_stats
 app = Flask(__name__)
+app.json = FastJSONProvider(app)
 app.config["JWT_SECRET_KEY"] = os.environ.get("JWT_SECRET_KEY", "your-super-secret-key-change-this")
 
 # CORRECTED: Allow requests from your Render frontend and local development environment
@@ -23,30 +34,61 @@ origins = [
 ]
 CORS(app, resources={r"/api/*": {"origins": origins}})
 
-bcrypt = Bcrypt(app)
 jwt = JWTManager(app)
+instrument_app(app)
 
 # --- Configuration & Setup ---
-GEOAPIFY_API_KEY = os.getenv("GEOAPIFY_API_KEY")
-DB_NAME = 'travel.db'
-
-# We will "lazy-load" the model inside the /chat endpoint to ensure a fast and stable server startup.
-nlp = None
+# /api/venues fans its upstream calls out on this pool and gives up on whatever
+# has not answered once the deadline passes.
+VENUES_DEADLINE_SECONDS = float(os.environ.get("VENUES_DEADLINE_SECONDS", 8))
+venue_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=int(os.environ.get("VENUES_MAX_WORKERS", 8)), thread_name_prefix="venues")
+# Profiled requests also sample the venue lookup threads they fan out to.
+attach_profiler(app, thread_prefixes=("venues",), exclude_endpoints=("get_profile",))
+VENUES_BATCH_MAX_CITIES = int(os.environ.get("VENUES_BATCH_MAX_CITIES", 20))
+
+# Upper bound on destination IDs accepted by one /api/saved/bulk call.
+SAVED_BULK_MAX_IDS = int(os.environ.get("SAVED_BULK_MAX_IDS", 500))
+
+# /api/stats exposes SQL fingerprints and plans, so it is only served to
+# requests carrying STATS_TOKEN in this header; without the token it is off.
+STATS_TOKEN = os.environ.get("STATS_TOKEN")
+STATS_HEADER = "X-Stats-Token"
+
+# /api/nearby answers from the in-memory catalogue's spatial grid; radius is in km.
+NEARBY_DEFAULT_RADIUS_KM = 50
+NEARBY_MAX_RADIUS_KM = 500
 
 SYNONYM_MAP = {"romantic": "romance", "historical": "history", "adventurous": "adventure", "relaxing": "relaxation", "cultural": "culture", "mountains": "mountain"}
 STOP_WORDS = {"trip", "vacation", "holiday", "getaway", "journey", "tour", "destination", "place"}
 
-def get_db_connection():
-    db_url = os.environ.get('DATABASE_URL')
-    if db_url:
-        # Use PostgreSQL on Render
-        engine = sqlalchemy.create_engine(db_url)
-        conn = engine.connect()
-    else:
-        # Use SQLite for local development
-        conn = sqlite3.connect(DB_NAME)
-        conn.row_factory = sqlite3.Row
-    return conn
+# Lemmatised search terms (and the message vector used for semantic search)
+# keyed by the normalised chat message, so repeated prompts skip spaCy.
+search_terms_cache = LRUCache(
+    maxsize=int(os.environ.get("SEARCH_TERMS_CACHE_SIZE", 2048)),
+    ttl=float(os.environ.get("SEARCH_TERMS_CACHE_TTL", 3600)) or None,
+)
+
+def analyse_message(normalized):
+    analysis = search_terms_cache.get(normalized)
+    if analysis is None:
+        doc = process(normalized)
+        search_terms = frozenset(SYNONYM_MAP.get(token.lemma_, token.lemma_) for token in doc if token.lemma_ not in STOP_WORDS)
+        query_vector = normalize_vector(doc.vector) if semantic_search_available() and has_static_vectors() else None
+        analysis = (search_terms, query_vector)
+        search_terms_cache.set(normalized, analysis)
+    return analysis
+
+# Serialised /api/chat responses. Keys include the catalogue version, and the
+# cache is dropped whenever that version changes.
+chat_results_cache = LRUCache(
+    maxsize=int(os.environ.get("CHAT_RESULTS_CACHE_SIZE", 1024)),
+    ttl=float(os.environ.get("CHAT_RESULTS_CACHE_TTL", 0)) or None,
+)
+
+@on_catalogue_change
+def invalidate_catalogue_caches(version):
+    chat_results_cache.clear()
 
 # --- Authentication Endpoints ---
 @app.route('/api/register', methods=['POST'])
@@ -61,20 +103,46 @@ def register():
     # CORRECTED: Use SQLAlchemy named parameter syntax (:username)
     user_query = sqlalchemy.text("SELECT * FROM users WHERE username = :username")
     user = conn.execute(user_query, {'username': username}).fetchone()
+    # Hand the connection back before hashing, which can wait on the bcrypt pool.
+    conn.close()
 
     if user:
-        conn.close()
         return jsonify({"msg": "Username already exists"}), 409
 
-    hashed_password = bcrypt.generate_password_hash(password).decode('utf-8')
-    # CORRECTED: Use SQLAlchemy syntax for INSERT
-    insert_query = sqlalchemy.text("INSERT INTO users (username, password) VALUES (:username, :password)")
-    conn.execute(insert_query, {'username': username, 'password': hashed_password})
+    try:
+        hashed_password = hash_password(password)
+    except PasswordHasherBusy as e:
+        print(f"Register rejected: {e}")
+        return jsonify({"msg": "Server busy, please try again"}), 503
+    # The unique username index settles a race with another registration
+    # that slipped in while the password was being hashed.
+    conn = get_db_connection()
+    insert_query = sqlalchemy.text("""
+        INSERT INTO users (username, password) VALUES (:username, :password)
+        ON CONFLICT (username) DO NOTHING
+        RETURNING id
+    """)
+    inserted = conn.execute(insert_query, {'username': username, 'password': hashed_password}).fetchone()
     # For SQLAlchemy with PostgreSQL, you may need to commit the transaction
     if hasattr(conn, 'commit'): conn.commit()
     conn.close()
+    if inserted is None:
+        return jsonify({"msg": "Username already exists"}), 409
     return jsonify({"msg": "User created successfully"}), 201
 
+def upgrade_password_hash(user_id, old_hash, password):
+    """Re-hash a password stored with an outdated BCRYPT_ROUNDS cost."""
+    new_hash = hash_password(password)
+    conn = get_db_connection()
+    # Only replace the hash we verified, in case the password changed meanwhile.
+    result = conn.execute(
+        sqlalchemy.text("UPDATE users SET password = :new_hash WHERE id = :id AND password = :old_hash"),
+        {'new_hash': new_hash, 'id': user_id, 'old_hash': old_hash})
+    if hasattr(conn, 'commit'): conn.commit()
+    conn.close()
+    if result.rowcount:
+        record_rehash()
+
 @app.route('/api/login', methods=['POST'])
 def login():
     data = request.json
@@ -92,7 +160,18 @@ def login():
     # Convert SQLAlchemy Row to a dict-like object if it's not already
     if user:
         user_dict = dict(user._mapping) if hasattr(user, '_mapping') else user
-        if bcrypt.check_password_hash(user_dict['password'], password):
+        try:
+            valid = check_password(user_dict['password'], password)
+        except PasswordHasherBusy as e:
+            print(f"Login rejected: {e}")
+            return jsonify({"msg": "Server busy, please try again"}), 503
+        if valid:
+            if needs_rehash(user_dict['password']):
+                try:
+                    upgrade_password_hash(user_dict['id'], user_dict['password'], password)
+                except PasswordHasherBusy as e:
+                    # Not worth failing the login over; the next one retries.
+                    print(f"Skipped password rehash for user {user_dict['id']}: {e}")
             access_token = create_access_token(identity=str(user_dict['id']))
             return jsonify(access_token=access_token, username=username)
 
@@ -102,65 +181,71 @@ def login():
 # --- Main App Endpoints ---
 @app.route('/api/chat', methods=['POST'])
 def chat():
-    global nlp
-
-    if nlp is None:
-        try:
-            print("Loading SpaCy model for the first time...")
-            nlp = spacy.load("en_core_web_sm")
-            print("SpaCy model loaded successfully.")
-        except IOError:
-            print("Fatal: SpaCy model not found on server.")
-            return jsonify({"error": "Language model is temporarily unavailable"}), 503
+    try:
+        load_model()
+    except IOError:
+        print("Fatal: SpaCy model not found on server.")
+        return jsonify({"error": "Language model is temporarily unavailable"}), 503
 
     data = request.json
     user_message, traveler_type, trip_scope, budget = data.get('message', ''), data.get('travelerType', 'solo'), data.get('tripScope', 'international'), data.get('budget', 'any')
     if not user_message: return jsonify([])
 
-    doc = nlp(user_message.lower())
-    search_terms = {SYNONYM_MAP.get(token.lemma_, token.lemma_) for token in doc if token.lemma_ not in STOP_WORDS}
-
-    conn = get_db_connection()
-    params = {'trip_scope': f'%{trip_scope}%', 'traveler_type': f'%{traveler_type}%'}
-    query_str = "SELECT * FROM destinations WHERE tags LIKE :trip_scope AND tags LIKE :traveler_type"
-
-    if budget != 'any':
-        query_str += " AND cost_tier = :budget"
-        params['budget'] = budget
-    if search_terms:
-        keyword_filters = []
-        for i, term in enumerate(search_terms):
-            param_name = f'term_{i}'
-            keyword_filters.append(f"tags LIKE :{param_name}")
-            params[param_name] = f'%{term}%'
-        query_str += " AND (" + " OR ".join(keyword_filters) + ")"
-
-    query_str += " ORDER BY name LIMIT 30"
-    query = sqlalchemy.text(query_str)
-    results = conn.execute(query, params).fetchall()
-    conn.close()
-    return jsonify([dict(row._mapping) for row in results])
-
-def fetch_venues_by_category(lon, lat, categories, limit=10):
-    places_url = f"https://api.geoapify.com/v2/places?categories={categories}&filter=circle:{lon},{lat},15000&bias=proximity:{lon},{lat}&limit={limit}&apiKey={GEOAPIFY_API_KEY}"
-
-    # Setup a session with a retry strategy
-    session = requests.Session()
-    retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[500, 502, 503, 504])
-    adapter = HTTPAdapter(max_retries=retry)
-    session.mount('http://', adapter)
-    session.mount('https://', adapter)
-
+    normalized = " ".join(user_message.lower().split())
+    search_terms, query_vector = analyse_message(normalized)
+
+    snapshot = get_snapshot(get_db_connection)
+    # The message vector depends on more than its search terms, so semantic
+    # results are cached per message rather than per set of terms.
+    cache_key = (snapshot.version, tuple(sorted(search_terms)), traveler_type, trip_scope, budget,
+                 normalized if query_vector is not None else None)
+    payload = chat_results_cache.get(cache_key)
+    if payload is None:
+        results = snapshot.search(trip_scope, traveler_type, budget, search_terms, limit=30, query_vector=query_vector)
+        payload = b"".join(stream_json_array(snapshot.destination_json(d, app.json.dumps_bytes) for d in results))
+        chat_results_cache.set(cache_key, payload)
+    return app.response_class(payload, mimetype='application/json')
+
+VENUE_CATEGORIES = ("tourism.sights", "catering.restaurant")
+
+def add_maps_url(venue):
+    base_url = "https://www.google.com/maps/search/?api=1&query="
+    if 'name' in venue and 'address' in venue and 'not available' not in venue.get('address', '').lower():
+        search_query = f"{venue['name']}, {venue['address']}"
+        venue['Maps_url'] = f"{base_url}{urllib.parse.quote_plus(search_query)}"
+    elif 'lat' in venue and 'lon' in venue:
+        venue['Maps_url'] = f"{base_url}{venue['lat']},{venue['lon']}"
+    return venue
+
+def result_or_empty(future, label):
+    if not future.done():
+        print(f"Venue lookup '{label}' missed the {VENUES_DEADLINE_SECONDS}s deadline.")
+        return []
     try:
-        response = session.get(places_url)
-        response.raise_for_status() # Raise an exception for bad status codes
-        features = response.json().get('features', [])
-        venues = [{'id': prop.get('place_id'),'name': prop.get('name'),'address': prop.get('address_line2', 'Address not available'),'lon': coords[0],'lat': coords[1]} for venue in features if (prop := venue.get('properties', {})) and (coords := venue.get('geometry', {}).get('coordinates')) and prop.get('name')]
-        return venues
-    except requests.exceptions.RequestException as e:
-        print(f"API call to Geoapify failed after retries: {e}")
+        return future.result()
+    except Exception as e:
+        print(f"Venue lookup '{label}' failed: {e}")
         return []
 
+def categorize_venues(curated_results, api_attractions, api_restaurants):
+    """Curated landmarks first, then Geoapify results whose names are not already listed."""
+    categorized_venues = {"attractions": [], "restaurants": []}
+    existing_venue_names = set()
+    for landmark in curated_results:
+        venue_data = add_maps_url(landmark.to_dict())
+        category_key = f"{venue_data['category']}s"
+        if category_key in categorized_venues:
+            categorized_venues[category_key].append(venue_data)
+            existing_venue_names.add(venue_data['name'].lower())
+
+    for attraction in api_attractions:
+        if attraction['name'].lower() not in existing_venue_names:
+            categorized_venues["attractions"].append(add_maps_url(attraction))
+    for restaurant in api_restaurants:
+        if restaurant['name'].lower() not in existing_venue_names:
+            categorized_venues["restaurants"].append(add_maps_url(restaurant))
+    return categorized_venues
+
 @app.route('/api/venues', methods=['POST'])
 def get_venues():
     data = request.json
@@ -170,50 +255,85 @@ def get_venues():
     if not all([city_id, lat, lon]):
         return jsonify({"error": "City ID and coordinates are required"}), 400
 
-    categorized_venues = {"attractions": [], "restaurants": []}
-
-    def add_maps_url(venue):
-        base_url = "https://www.google.com/maps/search/?api=1&query="
-        if 'name' in venue and 'address' in venue and 'not available' not in venue.get('address', '').lower():
-            search_query = f"{venue['name']}, {venue['address']}"
-            venue['Maps_url'] = f"{base_url}{urllib.parse.quote_plus(search_query)}"
-        elif 'lat' in venue and 'lon' in venue:
-            venue['Maps_url'] = f"{base_url}{venue['lat']},{venue['lon']}"
-        return venue
+    # Issue both Geoapify lookups together and wait for them only up to the
+    # request deadline; curated landmarks come from the in-memory catalogue.
+    api_futures = {}
+    if GEOAPIFY_API_KEY:
+        api_futures = {category: venue_executor.submit(bind(get_cached_venues), lon, lat, category)
+                       for category in VENUE_CATEGORIES}
+    concurrent.futures.wait(api_futures.values(), timeout=VENUES_DEADLINE_SECONDS)
+    api_results = {category: result_or_empty(future, f"{category} for {city_id}") for category, future in api_futures.items()}
+
+    curated_results = get_snapshot(get_db_connection).landmarks_for(city_id)
+    return jsonify(categorize_venues(curated_results, api_results.get("tourism.sights", []),
+                                     api_results.get("catering.restaurant", [])))
+
+@app.route('/api/venues/batch', methods=['POST'])
+def get_venues_batch():
+    data = request.json or {}
+    city_ids = data.get('city_ids')
+    if not isinstance(city_ids, list) or not city_ids:
+        return jsonify({"error": "city_ids must be a non-empty list"}), 400
+    city_ids = list(dict.fromkeys(str(city_id) for city_id in city_ids))
+    if len(city_ids) > VENUES_BATCH_MAX_CITIES:
+        return jsonify({"error": f"At most {VENUES_BATCH_MAX_CITIES} cities per request"}), 400
+
+    started = time.monotonic()
+    snapshot = get_snapshot(get_db_connection)
+    cities = [snapshot.by_id[city_id] for city_id in city_ids if city_id in snapshot.by_id]
+    missing = [city_id for city_id in city_ids if city_id not in snapshot.by_id]
+
+    # One upstream lookup per distinct (geo tile, category): cities sharing a
+    # tile share the result. They all run while the review summaries load.
+    api_futures = {}
+    if GEOAPIFY_API_KEY:
+        for city in cities:
+            for category in VENUE_CATEGORIES:
+                key = (tile_for(city.lon, city.lat)[:2], category)
+                if key not in api_futures:
+                    api_futures[key] = venue_executor.submit(bind(get_cached_venues), city.lon, city.lat, category)
 
     conn = get_db_connection()
-    # CORRECTED: Use SQLAlchemy syntax
-    query = sqlalchemy.text("SELECT * FROM landmarks WHERE destination_id = :city_id")
-    curated_results = conn.execute(query, {'city_id': city_id}).fetchall()
+    summaries = fetch_review_summaries(conn, [city.id for city in cities])
     conn.close()
 
-    existing_venue_names = set()
-    if curated_results:
-        for landmark in curated_results:
-            venue_data = add_maps_url(dict(landmark._mapping))
-            category_key = f"{venue_data['category']}s"
-            if category_key in categorized_venues:
-                categorized_venues[category_key].append(venue_data)
-                existing_venue_names.add(venue_data['name'].lower())
+    concurrent.futures.wait(api_futures.values(), timeout=max(VENUES_DEADLINE_SECONDS - (time.monotonic() - started), 0))
+    api_results = {key: result_or_empty(future, f"{key[1]} for tile {key[0]}") for key, future in api_futures.items()}
 
-    if GEOAPIFY_API_KEY:
-        api_attractions = fetch_venues_by_category(lon, lat, "tourism.sights")
-        api_restaurants = fetch_venues_by_category(lon, lat, "catering.restaurant")
-
-        for attraction in api_attractions:
-            if attraction['name'].lower() not in existing_venue_names:
-                categorized_venues["attractions"].append(add_maps_url(attraction))
-        for restaurant in api_restaurants:
-            if restaurant['name'].lower() not in existing_venue_names:
-                categorized_venues["restaurants"].append(add_maps_url(restaurant))
+    results = {}
+    for city in cities:
+        tile = tile_for(city.lon, city.lat)[:2]
+        city_api = {category: [dict(venue) for venue in api_results.get((tile, category), [])] for category in VENUE_CATEGORIES}
+        venues = categorize_venues(snapshot.landmarks_for(city.id), city_api["tourism.sights"], city_api["catering.restaurant"])
+        venues["reviews"] = summaries[city.id]
+        results[city.id] = venues
+    return jsonify({"cities": results, "missing": missing})
 
-    return jsonify(categorized_venues)
+@app.route('/api/nearby', methods=['GET'])
+def nearby():
+    try:
+        lat = float(request.args['lat'])
+        lon = float(request.args['lon'])
+        radius = float(request.args.get('radius', NEARBY_DEFAULT_RADIUS_KM))
+        limit = int(request.args.get('limit', 50))
+    except (KeyError, ValueError):
+        return jsonify({"error": "lat and lon are required; radius (km) and limit must be numbers"}), 400
+    if not (-90 <= lat <= 90 and -180 <= lon <= 180) or radius <= 0:
+        return jsonify({"error": "Coordinates or radius out of range"}), 400
+    radius, limit = min(radius, NEARBY_MAX_RADIUS_KM), min(max(limit, 1), 200)
+
+    snapshot = get_snapshot(get_db_connection)
+    def with_distance(matches):
+        return [dict(item.to_dict(), distance_km=round(distance, 2)) for distance, item in matches]
+    return jsonify({
+        "landmarks": with_distance(snapshot.landmark_grid.within(lat, lon, radius, limit)),
+        "destinations": with_distance(snapshot.destination_grid.within(lat, lon, radius, limit)),
+    })
 
 @app.route('/api/saved', methods=['GET', 'POST'])
 @jwt_required()
 def handle_saved_destinations():
     current_user_id = get_jwt_identity()
-    conn = get_db_connection()
 
     if request.method == 'POST':
         data = request.json
@@ -221,27 +341,70 @@ def handle_saved_destinations():
         if not destination_id:
             return jsonify({"msg": "Destination ID is required"}), 400
 
-        # CORRECTED: Use SQLAlchemy syntax
-        existing_query = sqlalchemy.text("SELECT id FROM saved_destinations WHERE user_id = :user_id AND destination_id = :dest_id")
-        existing = conn.execute(existing_query, {'user_id': current_user_id, 'dest_id': destination_id}).fetchone()
-        if existing:
-            return jsonify({"msg": "Destination already saved"}), 409
-
-        insert_query = sqlalchemy.text("INSERT INTO saved_destinations (user_id, destination_id) VALUES (:user_id, :dest_id)")
-        conn.execute(insert_query, {'user_id': current_user_id, 'dest_id': destination_id})
+        # One round trip: the unique (user_id, destination_id) index turns a
+        # duplicate save into "no row returned" instead of a race.
+        conn = get_db_connection()
+        insert_query = sqlalchemy.text("""
+            INSERT INTO saved_destinations (user_id, destination_id) VALUES (:user_id, :dest_id)
+            ON CONFLICT (user_id, destination_id) DO NOTHING
+            RETURNING id
+        """)
+        inserted = conn.execute(insert_query, {'user_id': current_user_id, 'dest_id': destination_id}).fetchone()
         if hasattr(conn, 'commit'): conn.commit()
         conn.close()
+        if inserted is None:
+            return jsonify({"msg": "Destination already saved"}), 409
         return jsonify({"msg": "Destination saved successfully"}), 201
 
-    # GET request - CORRECTED: Use SQLAlchemy syntax
-    saved_query = sqlalchemy.text("""
-        SELECT d.* FROM destinations d
-        JOIN saved_destinations sd ON d.id = sd.destination_id
-        WHERE sd.user_id = :user_id
-    """)
-    saved = conn.execute(saved_query, {'user_id': current_user_id}).fetchall()
+    # GET request - destination details come from the in-memory catalogue.
+    # Only the saved IDs are read, and the connection is released
+    # before the body is written from each destination's cached JSON.
+    snapshot = get_snapshot(get_db_connection)
+    conn = get_db_connection()
+    saved_query = sqlalchemy.text("SELECT destination_id FROM saved_destinations WHERE user_id = :user_id")
+    saved_ids = conn.execute(saved_query, {'user_id': current_user_id}).scalars().all()
     conn.close()
-    return jsonify([dict(row._mapping) for row in saved])
+    fragments = (snapshot.destination_json(snapshot.by_id[dest_id], app.json.dumps_bytes)
+                 for dest_id in saved_ids if dest_id in snapshot.by_id)
+    return app.response_class(stream_json_array(fragments), mimetype='application/json')
+
+
+@app.route('/api/saved/bulk', methods=['POST'])
+@jwt_required()
+def bulk_update_saved_destinations():
+    current_user_id = get_jwt_identity()
+    data = request.json or {}
+    to_save, to_remove = data.get('save', []), data.get('remove', [])
+    if not isinstance(to_save, list) or not isinstance(to_remove, list):
+        return jsonify({"msg": "save and remove must be lists of destination IDs"}), 400
+    to_save = list(dict.fromkeys(str(dest_id) for dest_id in to_save))
+    to_remove = list(dict.fromkeys(str(dest_id) for dest_id in to_remove))
+    if len(to_save) + len(to_remove) > SAVED_BULK_MAX_IDS:
+        return jsonify({"msg": f"At most {SAVED_BULK_MAX_IDS} destination IDs per request"}), 400
+    if set(to_save) & set(to_remove):
+        return jsonify({"msg": "A destination cannot be both saved and removed"}), 400
+
+    # Each side is a single statement in one transaction. Inserting from the
+    # destinations table skips unknown IDs; RETURNING reports what changed.
+    saved, removed = [], []
+    conn = get_db_connection()
+    if to_save:
+        insert_query = sqlalchemy.text("""
+            INSERT INTO saved_destinations (user_id, destination_id)
+            SELECT :user_id, id FROM destinations WHERE id IN :ids
+            ON CONFLICT (user_id, destination_id) DO NOTHING
+            RETURNING destination_id
+        """).bindparams(sqlalchemy.bindparam('ids', expanding=True))
+        saved = [row[0] for row in conn.execute(insert_query, {'user_id': current_user_id, 'ids': to_save})]
+    if to_remove:
+        delete_query = sqlalchemy.text("""
+            DELETE FROM saved_destinations WHERE user_id = :user_id AND destination_id IN :ids
+            RETURNING destination_id
+        """).bindparams(sqlalchemy.bindparam('ids', expanding=True))
+        removed = [row[0] for row in conn.execute(delete_query, {'user_id': current_user_id, 'ids': to_remove})]
+    if hasattr(conn, 'commit'): conn.commit()
+    conn.close()
+    return jsonify({"saved": saved, "removed": removed})
 
 
 @app.route('/api/saved/<string:destination_id>', methods=['DELETE'])
@@ -258,12 +421,24 @@ def delete_saved_destination(destination_id):
 
 @app.route('/api/reviews/<string:destination_id>', methods=['GET'])
 def get_reviews(destination_id):
+    cursor = request.args.get('cursor')
+    try:
+        limit = min(max(int(request.args.get('limit', DEFAULT_PAGE_SIZE)), 1), MAX_PAGE_SIZE)
+    except ValueError:
+        return jsonify({"msg": "limit must be an integer"}), 400
+
     conn = get_db_connection()
-    # CORRECTED: Use SQLAlchemy syntax
-    query = sqlalchemy.text("SELECT * FROM reviews WHERE destination_id = :dest_id ORDER BY timestamp DESC")
-    reviews = conn.execute(query, {'dest_id': destination_id}).fetchall()
+    try:
+        reviews, next_cursor = fetch_review_page(conn, destination_id, limit, cursor)
+    except ValueError:
+        conn.close()
+        return jsonify({"msg": "Invalid cursor"}), 400
+    response = {"reviews": [dict(row._mapping) for row in reviews], "next_cursor": next_cursor}
+    if not cursor:
+        # The summary only changes the first screen; later pages skip it.
+        response["summary"] = fetch_review_summaries(conn, [destination_id])[destination_id]
     conn.close()
-    return jsonify([dict(row._mapping) for row in reviews])
+    return jsonify(response)
 
 
 @app.route('/api/reviews', methods=['POST'])
@@ -278,6 +453,8 @@ def add_review():
 
     if not all([destination_id, rating, username]):
         return jsonify({"msg": "Missing required fields"}), 400
+    if type(rating) is not int or rating not in RATINGS:  # bool is an int subclass
+        return jsonify({"msg": "Rating must be a whole number from 1 to 5"}), 400
 
     conn = get_db_connection()
     # CORRECTED: Use SQLAlchemy syntax
@@ -290,12 +467,53 @@ def add_review():
         'comment': comment, 'username': username
     }
     conn.execute(query, params)
+    record_review_stats(conn, destination_id, rating)
     if hasattr(conn, 'commit'): conn.commit()
     conn.close()
 
     return jsonify({"msg": "Review added successfully"}), 201
 
 
+# --- Monitoring ---
+def stats_authorized(value):
+    return bool(STATS_TOKEN) and value is not None and hmac.compare_digest(
+        value.encode('utf-8', 'surrogateescape'), STATS_TOKEN.encode('utf-8', 'surrogateescape'))
+
+
+@app.route('/api/stats', methods=['GET'])
+def stats():
+    if not stats_authorized(request.headers.get(STATS_HEADER)):
+        return jsonify({"msg": "Not found"}), 404
+    return jsonify({
+        "db_pool": get_pool_stats(),
+        "nlp": get_nlp_stats(),
+        "search_terms_cache": search_terms_cache.stats(),
+        "chat_results_cache": chat_results_cache.stats(),
+        "geoapify_http": get_http_stats(),
+        "venue_cache": get_venue_cache_stats(),
+        "passwords": get_password_stats(),
+        "queries": get_query_stats(),
+        "profiler": get_profiler_stats(),
+    })
+
+
+@app.route('/api/metrics', methods=['GET'])
+def metrics():
+    if not METRICS_ENABLED:
+        return jsonify({"msg": "Metrics are disabled; set METRICS_ENABLED=true"}), 404
+    return app.response_class(render_prometheus(), mimetype='text/plain; version=0.0.4')
+
+
+@app.route('/api/profiles/<string:profile_id>', methods=['GET'])
+def get_profile(profile_id):
+    if not profiler_authorized(request.headers.get(PROFILE_HEADER)):
+        return jsonify({"msg": "Not found"}), 404
+    profile = read_profile(profile_id)
+    if profile is None:
+        return jsonify({"msg": "Not found"}), 404
+    return app.response_class(profile, mimetype='text/plain')
+
+
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5000))
     app.run(host='0.0.0.0', port=port)
\ No newline at end of file
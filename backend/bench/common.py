@@ -0,0 +1,140 @@
+import os
+import sys
+import time
+import socket
+import threading
+import subprocess
+import contextlib
+import requests
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCH_DIR = os.path.join(BACKEND_DIR, 'bench')
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def wait_for(url, timeout=60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            requests.get(url, timeout=1)
+            return
+        except requests.exceptions.RequestException:
+            time.sleep(0.2)
+    raise RuntimeError(f"{url} did not come up within {timeout}s")
+
+
+@contextlib.contextmanager
+def running(cmd, env=None, ready_url=None):
+    proc = subprocess.Popen(cmd, cwd=BACKEND_DIR, env=dict(os.environ, **(env or {})),
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        if ready_url:
+            wait_for(ready_url)
+        yield proc
+    finally:
+        proc.terminate()
+        try:
+            proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+
+def fake_geoapify(latency_ms=150, jitter_ms=0, error_rate=0.0):
+    """Run bench/fake_geoapify.py; yields the GEOAPIFY_PLACES_URL to use."""
+    port = free_port()
+    cmd = [sys.executable, os.path.join(BENCH_DIR, 'fake_geoapify.py'), '--port', str(port),
+           '--latency-ms', str(latency_ms), '--jitter-ms', str(jitter_ms), '--error-rate', str(error_rate)]
+    url = f"http://127.0.0.1:{port}/v2/places"
+
+    @contextlib.contextmanager
+    def context():
+        with running(cmd, ready_url=f"http://127.0.0.1:{port}/"):
+            yield url
+    return context()
+
+
+def seed_database(database_url, reset=True):
+    """Load the seed catalogue with create_db.py (``--reset`` drops existing tables).
+
+    The bench logs in as testuser, so a synced database gets it added too.
+    """
+    cmd = [sys.executable, 'create_db.py'] + (['--reset'] if reset else ['--test-user'])
+    subprocess.run(cmd, cwd=BACKEND_DIR, check=True, env=dict(os.environ, DATABASE_URL=database_url),
+                   stdout=subprocess.DEVNULL)
+
+
+def gunicorn(env, worker_class='sync', workers=2, worker_connections=100):
+    """Run the app under gunicorn; yields its base URL."""
+    port = free_port()
+    cmd = [sys.executable, '-m', 'gunicorn', 'app:app', '--bind', f"127.0.0.1:{port}",
+           '--workers', str(workers), '--worker-class', worker_class,
+           '--worker-connections', str(worker_connections), '--timeout', '120']
+    base_url = f"http://127.0.0.1:{port}"
+
+    @contextlib.contextmanager
+    def context():
+        with running(cmd, env=env, ready_url=f"{base_url}/api/stats"):
+            yield base_url
+    return context()
+
+
+def run_load(send, concurrency, duration):
+    """Call ``send(session, i)`` from ``concurrency`` threads for ``duration`` seconds.
+
+    ``send`` returns a requests.Response; anything but a 2xx counts as an error.
+    """
+    latencies, errors = [], [0]
+    lock = threading.Lock()
+    stop_at = time.monotonic() + duration
+
+    def client(worker_index):
+        session = requests.Session()
+        i = worker_index
+        while time.monotonic() < stop_at:
+            start = time.perf_counter()
+            try:
+                ok = send(session, i).ok
+            except requests.exceptions.RequestException:
+                ok = False
+            elapsed = time.perf_counter() - start
+            with lock:
+                if ok:
+                    latencies.append(elapsed)
+                else:
+                    errors[0] += 1
+            i += concurrency
+
+    started = time.monotonic()
+    threads = [threading.Thread(target=client, args=(n,)) for n in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return summarize(latencies, errors[0], time.monotonic() - started)
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return None
+    index = min(int(round(pct / 100 * (len(sorted_values) - 1))), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+def summarize(latencies, errors, elapsed):
+    latencies = sorted(latencies)
+    ms = lambda value: round(value * 1000, 2) if value is not None else None
+    return {
+        'requests': len(latencies),
+        'errors': errors,
+        'seconds': round(elapsed, 2),
+        'throughput_rps': round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+        'p50_ms': ms(percentile(latencies, 50)),
+        'p95_ms': ms(percentile(latencies, 95)),
+        'p99_ms': ms(percentile(latencies, 99)),
+        'max_ms': ms(latencies[-1] if latencies else None),
+    }
@@ -0,0 +1,42 @@
+"""Compare two run_bench.py artifacts endpoint by endpoint.
+
+    python bench/compare_results.py bench/results/before.json bench/results/after.json
+"""
+import sys
+import json
+import argparse
+
+METRICS = ['throughput_rps', 'p50_ms', 'p95_ms', 'p99_ms']
+
+
+def change(before, after):
+    if before in (None, 0) or after is None:
+        return 'n/a'
+    return f"{(after - before) / before * 100:+.1f}%"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('before')
+    parser.add_argument('after')
+    args = parser.parse_args()
+
+    with open(args.before) as f:
+        before = json.load(f)
+    with open(args.after) as f:
+        after = json.load(f)
+
+    for key in ('worker_class', 'workers', 'concurrency', 'database', 'geoapify_latency_ms'):
+        if before['meta'].get(key) != after['meta'].get(key):
+            print(f"warning: {key} differs ({before['meta'].get(key)} vs {after['meta'].get(key)})", file=sys.stderr)
+
+    print(f"{'endpoint':<10} {'metric':<15} {'before':>10} {'after':>10} {'change':>9}")
+    for endpoint in sorted(set(before['endpoints']) | set(after['endpoints'])):
+        old, new = before['endpoints'].get(endpoint, {}), after['endpoints'].get(endpoint, {})
+        for metric in METRICS + ['errors']:
+            old_value, new_value = old.get(metric), new.get(metric)
+            print(f"{endpoint:<10} {metric:<15} {str(old_value):>10} {str(new_value):>10} {change(old_value, new_value):>9}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""Compare /api/venues throughput under sync and gevent gunicorn workers.
+
+    cd backend && python bench/compare_workers.py --concurrency 50 --duration 15
+
+Seeds a throwaway SQLite database, points Geoapify at bench/fake_geoapify.py
+with the given latency and disables the venue cache, so every request really
+waits on the upstream. Prints one JSON result per worker class.
+"""
+import os
+import sys
+import json
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from common import fake_geoapify, gunicorn, run_load, seed_database  # noqa: E402
+
+
+def city_payload(i):
+    # Spread requests over many distinct coordinates.
+    return {'city': {'id': 'goa001', 'lat': 15.0 + (i % 500) * 0.01, 'lon': 74.0}}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--concurrency', type=int, default=50)
+    parser.add_argument('--duration', type=float, default=15)
+    parser.add_argument('--latency-ms', type=float, default=200)
+    parser.add_argument('--worker-classes', default='sync,gevent')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        seed_database(database_url)
+        results = []
+        with fake_geoapify(latency_ms=args.latency_ms) as places_url:
+            env = {
+                'DATABASE_URL': database_url, 'GEOAPIFY_API_KEY': 'bench', 'GEOAPIFY_PLACES_URL': places_url,
+                'VENUE_CACHE_PATH': os.path.join(tmp, 'venue_cache.db'),
+                'VENUE_CACHE_TTL': '0', 'VENUE_CACHE_STALE_SECONDS': '0', 'VENUE_CACHE_NEGATIVE_TTL': '0',
+                # Let the executor and HTTP pool keep up with a gevent worker.
+                'VENUES_MAX_WORKERS': str(args.concurrency * 2), 'GEOAPIFY_POOL_MAXSIZE': str(args.concurrency * 2),
+            }
+            for worker_class in args.worker_classes.split(','):
+                with gunicorn(env, worker_class=worker_class, workers=args.workers) as base_url:
+                    summary = run_load(
+                        lambda session, i: session.post(f"{base_url}/api/venues", json=city_payload(i), timeout=60),
+                        args.concurrency, args.duration)
+                summary.update({'worker_class': worker_class, 'workers': args.workers,
+                                'concurrency': args.concurrency, 'upstream_latency_ms': args.latency_ms})
+                results.append(summary)
+                print(json.dumps(summary))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""A local stand-in for the Geoapify Places API used by the benchmarks.
+
+    python bench/fake_geoapify.py --port 8900 --latency-ms 150 --jitter-ms 50 --error-rate 0.02
+
+Point the backend at it with GEOAPIFY_PLACES_URL=http://127.0.0.1:8900/v2/places.
+"""
+import json
+import time
+import random
+import argparse
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def make_features(lon, lat, categories, limit):
+    features = []
+    for i in range(limit):
+        offset = (i + 1) * 0.002
+        features.append({
+            'type': 'Feature',
+            'properties': {
+                'place_id': f"fake-{categories}-{lon:.3f}-{lat:.3f}-{i}",
+                'name': f"{categories.split('.')[-1].title()} {i + 1}",
+                'address_line2': f"{i + 1} Benchmark Street",
+                'categories': [categories],
+            },
+            'geometry': {'type': 'Point', 'coordinates': [lon + offset, lat - offset]},
+        })
+    return features
+
+
+class FakeGeoapifyHandler(BaseHTTPRequestHandler):
+    latency = 0.1
+    jitter = 0.0
+    error_rate = 0.0
+
+    def do_GET(self):
+        parsed = urllib.parse.urlparse(self.path)
+        if parsed.path != '/v2/places':
+            self.send_error(404)
+            return
+        query = urllib.parse.parse_qs(parsed.query)
+        time.sleep(max(self.latency + random.uniform(-self.jitter, self.jitter), 0))
+        if random.random() < self.error_rate:
+            self.send_error(503, "Injected failure")
+            return
+
+        try:
+            lon, lat = (float(v) for v in query['filter'][0].split(':', 1)[1].split(',')[:2])
+        except (KeyError, ValueError, IndexError):
+            lon, lat = 0.0, 0.0
+        limit = int(query.get('limit', ['10'])[0])
+        body = json.dumps({'type': 'FeatureCollection',
+                           'features': make_features(lon, lat, query.get('categories', ['place'])[0], limit)}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(port, latency_ms=100, jitter_ms=0, error_rate=0.0):
+    handler = type('Handler', (FakeGeoapifyHandler,), {
+        'latency': latency_ms / 1000, 'jitter': jitter_ms / 1000, 'error_rate': error_rate})
+    server = ThreadingHTTPServer(('127.0.0.1', port), handler)
+    server.daemon_threads = True
+    server.serve_forever()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--port', type=int, default=8900)
+    parser.add_argument('--latency-ms', type=float, default=100)
+    parser.add_argument('--jitter-ms', type=float, default=0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    args = parser.parse_args()
+    serve(args.port, args.latency_ms, args.jitter_ms, args.error_rate)
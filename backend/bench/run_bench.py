@@ -0,0 +1,163 @@
+"""Load-test the backend endpoints and write the results as JSON.
+
+    cd backend && python bench/run_bench.py --concurrency 20 --duration 10
+
+Seeds a throwaway SQLite database with create_db.py (or an existing database
+given with --database-url), starts bench/fake_geoapify.py and the app under
+gunicorn, then drives each scenario in turn. The artifact records throughput
+and p50/p95/p99 latency per scenario next to the settings used, so runs can be
+diffed with bench/compare_results.py.
+"""
+import os
+import sys
+import csv
+import json
+import time
+import platform
+import argparse
+import tempfile
+import subprocess
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from common import BACKEND_DIR, BENCH_DIR, fake_geoapify, gunicorn, run_load, seed_database  # noqa: E402
+
+SCENARIOS = ['login', 'chat', 'venues', 'saved', 'reviews']
+CHAT_MESSAGES = [
+    "a relaxing beach holiday",
+    "romantic trip with palaces and lakes",
+    "adventurous mountain trek on a budget",
+    "historical cities with great food",
+    "quiet nature escape for the family",
+    "party nightlife and beaches",
+]
+BENCH_USER = {'username': 'testuser', 'password': 'password'}
+
+
+def load_destinations():
+    with open(os.path.join(BACKEND_DIR, 'seed', 'destinations.csv'), newline='', encoding='utf-8') as f:
+        return [{'id': row['id'], 'lat': float(row['lat']), 'lon': float(row['lon'])} for row in csv.DictReader(f)]
+
+
+def make_scenarios(base_url, token, destinations, concurrency):
+    auth = {'Authorization': f"Bearer {token}"}
+
+    def login(session, i):
+        return session.post(f"{base_url}/api/login", json=BENCH_USER, timeout=60)
+
+    def chat(session, i):
+        payload = {'message': CHAT_MESSAGES[i % len(CHAT_MESSAGES)], 'travelerType': ['solo', 'couple', 'family'][i % 3],
+                   'tripScope': ['international', 'domestic'][i % 2], 'budget': 'any'}
+        return session.post(f"{base_url}/api/chat", json=payload, timeout=60)
+
+    def venues(session, i):
+        return session.post(f"{base_url}/api/venues", json={'city': destinations[i % len(destinations)]}, timeout=60)
+
+    def saved(session, i):
+        # Each client cycles save -> list -> unsave on its own destination.
+        dest_id = destinations[(i % concurrency) % len(destinations)]['id']
+        step = (i // concurrency) % 3
+        if step == 0:
+            return session.post(f"{base_url}/api/saved", json={'destination_id': dest_id}, headers=auth, timeout=60)
+        if step == 1:
+            return session.get(f"{base_url}/api/saved", headers=auth, timeout=60)
+        return session.delete(f"{base_url}/api/saved/{dest_id}", headers=auth, timeout=60)
+
+    def reviews(session, i):
+        dest_id = destinations[i % len(destinations)]['id']
+        if i % 10 == 0:
+            review = {'destination_id': dest_id, 'rating': i % 5 + 1, 'comment': 'Benchmark review',
+                      'username': BENCH_USER['username']}
+            return session.post(f"{base_url}/api/reviews", json=review, headers=auth, timeout=60)
+        return session.get(f"{base_url}/api/reviews/{dest_id}", timeout=60)
+
+    return {'login': login, 'chat': chat, 'venues': venues, 'saved': saved, 'reviews': reviews}
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=BACKEND_DIR, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scenarios', default=','.join(SCENARIOS))
+    parser.add_argument('--concurrency', type=int, default=20)
+    parser.add_argument('--duration', type=float, default=10, help="Seconds per scenario")
+    parser.add_argument('--warmup', type=float, default=2, help="Unrecorded seconds before each scenario")
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--worker-class', default='sync')
+    parser.add_argument('--database-url', help="Benchmark an existing database instead of a temporary SQLite file")
+    parser.add_argument('--reset', action='store_true', help="With --database-url, drop and reseed it first")
+    parser.add_argument('--geoapify-latency-ms', type=float, default=150)
+    parser.add_argument('--geoapify-jitter-ms', type=float, default=50)
+    parser.add_argument('--geoapify-error-rate', type=float, default=0.0)
+    parser.add_argument('--venue-cache', action='store_true', help="Keep the venue cache on (off by default)")
+    parser.add_argument('--output', help="Where to write the JSON artifact (default bench/results/<timestamp>.json)")
+    args = parser.parse_args()
+
+    scenario_names = [name.strip() for name in args.scenarios.split(',') if name.strip()]
+    unknown = set(scenario_names) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+
+    destinations = load_destinations()
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = args.database_url or f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        seed_database(database_url, reset=args.reset or not args.database_url)
+
+        with fake_geoapify(args.geoapify_latency_ms, args.geoapify_jitter_ms, args.geoapify_error_rate) as places_url:
+            env = {'DATABASE_URL': database_url, 'GEOAPIFY_API_KEY': 'bench', 'GEOAPIFY_PLACES_URL': places_url,
+                   'VENUE_CACHE_PATH': os.path.join(tmp, 'venue_cache.db')}
+            if not args.venue_cache:
+                env.update(VENUE_CACHE_TTL='0', VENUE_CACHE_STALE_SECONDS='0', VENUE_CACHE_NEGATIVE_TTL='0')
+
+            with gunicorn(env, worker_class=args.worker_class, workers=args.workers) as base_url:
+                login = requests.post(f"{base_url}/api/login", json=BENCH_USER, timeout=60)
+                login.raise_for_status()
+                token = login.json()['access_token']
+                scenarios = make_scenarios(base_url, token, destinations, args.concurrency)
+
+                def clear_saved():
+                    # A run can stop between save and unsave; start each one clean.
+                    requests.post(f"{base_url}/api/saved/bulk", json={'remove': [d['id'] for d in destinations]},
+                                  headers={'Authorization': f"Bearer {token}"}, timeout=60).raise_for_status()
+
+                for name in scenario_names:
+                    if args.warmup:
+                        run_load(scenarios[name], args.concurrency, args.warmup)
+                    if name == 'saved':
+                        clear_saved()
+                    results[name] = run_load(scenarios[name], args.concurrency, args.duration)
+                    print(f"{name}: {json.dumps(results[name])}")
+
+    artifact = {
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'git_revision': git_revision(),
+            'python': platform.python_version(),
+            'database': 'sqlite' if database_url.startswith('sqlite') else database_url.split(':', 1)[0],
+            'worker_class': args.worker_class,
+            'workers': args.workers,
+            'concurrency': args.concurrency,
+            'duration_seconds': args.duration,
+            'geoapify_latency_ms': args.geoapify_latency_ms,
+            'geoapify_jitter_ms': args.geoapify_jitter_ms,
+            'geoapify_error_rate': args.geoapify_error_rate,
+            'venue_cache': args.venue_cache,
+        },
+        'endpoints': results,
+    }
+    output = args.output or os.path.join(BENCH_DIR, 'results', time.strftime('%Y%m%d-%H%M%S') + '.json')
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(artifact, f, indent=2)
+    print(f"Wrote {output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+"""Measure JSON response encoding: stdlib vs orjson, and the streamed row path.
+
+    cd backend && python bench/serialization_bench.py --iterations 500
+
+Payloads are built from the seed catalogue, so no database or server is
+needed. For each payload and encoder it prints one JSON line with response
+size, throughput in MB/s and the peak memory traced by tracemalloc while
+producing a single response.
+"""
+import os
+import sys
+import csv
+import json
+import time
+import argparse
+import datetime
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from flask import Flask  # noqa: E402
+from serialization import FastJSONProvider, orjson, stream_json_array  # noqa: E402
+from catalogue_snapshot import DESTINATION_COLUMNS  # noqa: E402
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load_destination_dicts():
+    with open(os.path.join(BACKEND_DIR, 'seed', 'destinations.csv'), newline='', encoding='utf-8') as f:
+        rows = list(csv.DictReader(f))
+    for row in rows:
+        row['lat'], row['lon'] = float(row['lat']), float(row['lon'])
+    return [{col: row[col] for col in DESTINATION_COLUMNS} for row in rows]
+
+
+def make_payloads(destinations):
+    saved = (destinations * 3)[:500]
+    start = datetime.datetime(2024, 1, 1)
+    reviews = [{'id': i, 'destination_id': 'goa001', 'user_id': 1, 'username': f"user{i}", 'rating': i % 5 + 1,
+                'comment': "Lovely beaches, great food and friendly people. Would visit again.",
+                'timestamp': start + datetime.timedelta(hours=i)} for i in range(50)]
+    return {
+        'chat_30': destinations[:30],
+        'saved_500': saved,
+        'reviews_page_50': {'reviews': reviews, 'next_cursor': 'MjAyNC0wMS0wMVQwMDowMDowMHw1MA=='},
+    }
+
+
+def measure(fn, iterations):
+    body = fn()
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    elapsed = time.perf_counter() - start
+    return {
+        'bytes': len(body),
+        'us_per_response': round(elapsed / iterations * 1e6, 1),
+        'mb_per_second': round(len(body) * iterations / elapsed / 1e6, 2),
+        'peak_traced_bytes': peak,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--iterations', type=int, default=500)
+    args = parser.parse_args()
+
+    app = Flask(__name__)
+    encoders = {'stdlib': FastJSONProvider(app, use_orjson=False)}
+    if orjson is not None:
+        encoders['orjson'] = FastJSONProvider(app, use_orjson=True)
+    else:
+        print("orjson is not installed; only the stdlib encoder is measured.", file=sys.stderr)
+
+    destinations = load_destination_dicts()
+    payloads = make_payloads(destinations)
+    with app.app_context():
+        for payload_name, payload in payloads.items():
+            for encoder_name, provider in encoders.items():
+                result = measure(lambda: provider.response(payload).get_data(), args.iterations)
+                print(json.dumps(dict(payload=payload_name, path=f"jsonify/{encoder_name}", **result)))
+
+        # The /api/saved path: each destination is encoded once per snapshot and
+        # responses are assembled from those cached fragments as rows arrive.
+        for encoder_name, provider in encoders.items():
+            cache = {}
+
+            def fragment(d):
+                if d['id'] not in cache:
+                    cache[d['id']] = provider.dumps_bytes(d)
+                return cache[d['id']]
+
+            result = measure(lambda: b"".join(stream_json_array(fragment(d) for d in payloads['saved_500'])),
+                             args.iterations)
+            print(json.dumps(dict(payload='saved_500', path=f"stream/{encoder_name}", **result)))
+
+
+if __name__ == '__main__':
+    main()
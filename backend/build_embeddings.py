@@ -0,0 +1,53 @@
+import time
+import numpy as np
+from dotenv import load_dotenv
+
+# Offline step for semantic search: embed every destination's description and
+# tags with the same spaCy pipeline the workers use for chat messages, and
+# save the matrix for them to memory-map. Re-run after syncing the catalogue:
+#   python build_embeddings.py
+load_dotenv()
+
+from db import get_db_connection
+from catalogue_snapshot import load_snapshot
+from embeddings import EMBEDDINGS_PATH, normalize, save_embeddings
+from nlp_model import SPACY_MODEL, has_static_vectors, load_model
+
+
+def destination_text(destination):
+    return f"{destination.name}. {destination.description or ''} {destination.tags.replace(',', ' ')}"
+
+
+def build_embeddings():
+    conn = get_db_connection()
+    try:
+        snapshot = load_snapshot(conn)
+    finally:
+        conn.close()
+
+    nlp = load_model()
+    if not has_static_vectors(nlp):
+        print(f"Model '{SPACY_MODEL}' has no word vectors; nothing was written. "
+              f"Use a model with vectors such as en_core_web_md.")
+        return
+    start = time.perf_counter()
+    rows, ids = [], []
+    for destination, doc in zip(snapshot.destinations, nlp.pipe(destination_text(d) for d in snapshot.destinations)):
+        vector = normalize(doc.vector)
+        if vector is None:
+            print(f"  Skipping {destination.id}: the model produced no vector.")
+            continue
+        rows.append(vector)
+        ids.append(destination.id)
+
+    if not rows:
+        print("No destination had an in-vocabulary word; nothing was written.")
+        return
+    matrix = np.vstack(rows)
+    save_embeddings(matrix, ids, SPACY_MODEL, snapshot.version)
+    print(f"Wrote {matrix.shape[0]} x {matrix.shape[1]} embeddings for catalogue v{snapshot.version} "
+          f"to {EMBEDDINGS_PATH} in {time.perf_counter() - start:.2f}s.")
+
+
+if __name__ == '__main__':
+    build_embeddings()
@@ -0,0 +1,59 @@
+import os
+import time
+import threading
+import sqlalchemy
+
+# The destinations catalogue only changes when create_db.py (re)seeds it. Every
+# seed bumps catalogue_meta.version; workers poll it at most once per interval
+# and notify the registered listeners (caches, indexes) when it moves.
+VERSION_CHECK_SECONDS = float(os.environ.get("CATALOGUE_VERSION_CHECK_SECONDS", 30))
+
+_listeners = []
+_state = {'version': None, 'checked_at': 0.0}
+_state_lock = threading.Lock()
+
+
+def on_catalogue_change(callback):
+    """Register ``callback(version)`` to run when the catalogue version changes."""
+    _listeners.append(callback)
+    return callback
+
+
+def read_catalogue_version(conn):
+    try:
+        row = conn.execute(sqlalchemy.text("SELECT version FROM catalogue_meta WHERE id = 1")).fetchone()
+    except sqlalchemy.exc.SQLAlchemyError:
+        # Databases seeded before catalogue_meta existed have a single, fixed version.
+        if hasattr(conn, 'rollback'): conn.rollback()
+        return 0
+    return row[0] if row else 0
+
+
+def bump_catalogue_version(conn):
+    """Advance the stored catalogue version. Runs inside the caller's transaction."""
+    conn.execute(sqlalchemy.text("UPDATE catalogue_meta SET version = version + 1, updated_at = CURRENT_TIMESTAMP WHERE id = 1"))
+    return read_catalogue_version(conn)
+
+
+def get_catalogue_version(get_connection):
+    now = time.monotonic()
+    if _state['version'] is not None and now - _state['checked_at'] < VERSION_CHECK_SECONDS:
+        return _state['version']
+
+    with _state_lock:
+        if _state['version'] is not None and now - _state['checked_at'] < VERSION_CHECK_SECONDS:
+            return _state['version']
+        conn = get_connection()
+        try:
+            version = read_catalogue_version(conn)
+        finally:
+            conn.close()
+        previous = _state['version']
+        _state['version'] = version
+        _state['checked_at'] = now
+
+    if previous is not None and version != previous:
+        print(f"Catalogue version changed from {previous} to {version}; invalidating caches.")
+        for callback in _listeners:
+            callback(version)
+    return version
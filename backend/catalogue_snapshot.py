@@ -0,0 +1,118 @@
+import threading
+import sqlalchemy
+from catalogue_meta import get_catalogue_version, read_catalogue_version
+from tag_index import TagIndex
+from ranking import DestinationRanker
+from embeddings import semantic_scores
+from geo_index import GridIndex
+
+# Each worker keeps an immutable copy of the destinations and landmarks tables.
+# It is rebuilt off to the side when the catalogue version moves and swapped in
+# with a single reference assignment, so readers never see a half-built copy.
+DESTINATION_COLUMNS = ('id', 'name', 'city', 'country', 'description', 'tags', 'lat', 'lon', 'cost_tier')
+LANDMARK_COLUMNS = ('id', 'destination_id', 'name', 'category', 'address', 'lat', 'lon')
+
+
+class Destination:
+    __slots__ = DESTINATION_COLUMNS
+
+    def __init__(self, row):
+        for col in DESTINATION_COLUMNS:
+            setattr(self, col, row[col])
+
+    def to_dict(self):
+        return {col: getattr(self, col) for col in DESTINATION_COLUMNS}
+
+
+class Landmark:
+    __slots__ = LANDMARK_COLUMNS
+
+    def __init__(self, row):
+        for col in LANDMARK_COLUMNS:
+            setattr(self, col, row[col])
+
+    def to_dict(self):
+        return {col: getattr(self, col) for col in LANDMARK_COLUMNS}
+
+
+class CatalogueSnapshot:
+    __slots__ = ('version', 'destinations', 'by_id', 'landmarks_by_destination', 'tag_index', 'ranker',
+                 'destination_grid', 'landmark_grid', '_json_cache')
+
+    def __init__(self, version, destinations, landmarks):
+        self.version = version
+        # Kept in name order so a search can take the first N matches directly.
+        self.destinations = tuple(sorted(destinations, key=lambda d: d.name))
+        self.by_id = {d.id: d for d in self.destinations}
+        grouped = {}
+        for landmark in landmarks:
+            grouped.setdefault(landmark.destination_id, []).append(landmark)
+        self.landmarks_by_destination = {dest_id: tuple(items) for dest_id, items in grouped.items()}
+        self.tag_index = TagIndex([{'tags': d.tags, 'cost_tier': d.cost_tier} for d in self.destinations])
+        self.ranker = DestinationRanker(self.destinations)
+        self.destination_grid = GridIndex(self.destinations)
+        self.landmark_grid = GridIndex(landmarks)
+        self._json_cache = {}
+
+    def destination_json(self, destination, encode):
+        """``destination`` serialised with ``encode``, cached for the life of the snapshot."""
+        data = self._json_cache.get(destination.id)
+        if data is None:
+            data = self._json_cache[destination.id] = encode(destination.to_dict())
+        return data
+
+    def search(self, trip_scope, traveler_type, budget='any', search_terms=(), limit=30, query_vector=None):
+        """Return up to ``limit`` matching destinations, most relevant first.
+
+        With a ``query_vector``, destinations that pass the scope/traveler/budget
+        filters and are semantically close to the message are candidates too,
+        even when none of their tags match a search term.
+        """
+        # Positions are in name order, which is also how ties are broken.
+        bitmap = self.tag_index.match(trip_scope, traveler_type, budget, search_terms)
+        semantic = {}
+        if query_vector is not None:
+            filtered = TagIndex.positions(self.tag_index.match(trip_scope, traveler_type, budget))
+            semantic = semantic_scores(self, filtered, query_vector)
+            for position in semantic:
+                bitmap |= 1 << position
+        candidates = TagIndex.positions(bitmap)
+        top = self.ranker.top_k(candidates, search_terms, budget, limit, semantic)
+        return [self.destinations[position] for position in top]
+
+    def landmarks_for(self, destination_id):
+        return self.landmarks_by_destination.get(destination_id, ())
+
+
+_snapshot = None
+_reload_lock = threading.Lock()
+
+
+def load_snapshot(conn):
+    version = read_catalogue_version(conn)
+    destinations = [Destination(row._mapping) for row in conn.execute(
+        sqlalchemy.text(f"SELECT {', '.join(DESTINATION_COLUMNS)} FROM destinations"))]
+    landmarks = [Landmark(row._mapping) for row in conn.execute(
+        sqlalchemy.text(f"SELECT {', '.join(LANDMARK_COLUMNS)} FROM landmarks ORDER BY id"))]
+    return CatalogueSnapshot(version, destinations, landmarks)
+
+
+def get_snapshot(get_connection):
+    """Return the current snapshot, reloading it first if the catalogue version has moved."""
+    global _snapshot
+    version = get_catalogue_version(get_connection)
+    snapshot = _snapshot
+    if snapshot is not None and snapshot.version >= version:
+        return snapshot
+
+    with _reload_lock:
+        if _snapshot is None or _snapshot.version < version:
+            conn = get_connection()
+            try:
+                fresh = load_snapshot(conn)
+            finally:
+                conn.close()
+            print(f"Loaded catalogue snapshot v{fresh.version}: {len(fresh.destinations)} destinations, "
+                  f"{sum(len(items) for items in fresh.landmarks_by_destination.values())} landmarks.")
+            _snapshot = fresh
+        return _snapshot
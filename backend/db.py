@@ -0,0 +1,111 @@
+import os
+import time
+import threading
+import sqlalchemy
+from instrumentation import instrument_engine
+from query_log import attach_query_log
+
+# One engine (and therefore one connection pool) per worker process.
+# The pool is tuned through environment variables so it can be sized to the
+# number of gunicorn workers without touching code.
+DB_NAME = 'travel.db'
+POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', 5))
+MAX_OVERFLOW = int(os.environ.get('DB_MAX_OVERFLOW', 10))
+POOL_TIMEOUT = float(os.environ.get('DB_POOL_TIMEOUT', 30))
+POOL_RECYCLE = int(os.environ.get('DB_POOL_RECYCLE', 1800))
+POOL_PRE_PING = os.environ.get('DB_POOL_PRE_PING', 'true').lower() in ('1', 'true', 'yes')
+
+_engine = None
+_engine_pid = None
+_engine_lock = threading.Lock()
+
+# Time spent waiting for a connection to be handed out by the pool.
+_wait_stats = {'count': 0, 'total_seconds': 0.0, 'max_seconds': 0.0}
+_wait_lock = threading.Lock()
+
+
+def get_database_url():
+    db_url = os.environ.get('DATABASE_URL')
+    if db_url:
+        return db_url
+    # Use SQLite for local development
+    return f"sqlite:///{DB_NAME}"
+
+
+def _create_engine():
+    db_url = get_database_url()
+    if db_url.startswith('sqlite'):
+        engine = sqlalchemy.create_engine(db_url, pool_pre_ping=POOL_PRE_PING)
+    else:
+        engine = sqlalchemy.create_engine(
+            db_url,
+            pool_size=POOL_SIZE,
+            max_overflow=MAX_OVERFLOW,
+            pool_timeout=POOL_TIMEOUT,
+            pool_recycle=POOL_RECYCLE,
+            pool_pre_ping=POOL_PRE_PING,
+        )
+    instrument_engine(engine)
+    attach_query_log(engine)
+    return engine
+
+
+def get_engine():
+    global _engine, _engine_pid
+    pid = os.getpid()
+    if _engine is not None and _engine_pid == pid:
+        return _engine
+
+    with _engine_lock:
+        if _engine is not None and _engine_pid != pid:
+            # Inherited from the parent across a fork: never reuse the parent's
+            # sockets, just forget them and build a fresh pool for this process.
+            _engine.dispose(close=False)
+            _engine = None
+        if _engine is None:
+            _engine = _create_engine()
+            _engine_pid = pid
+    return _engine
+
+
+def _reset_after_fork():
+    global _engine, _engine_pid
+    if _engine is not None:
+        _engine.dispose(close=False)
+    _engine = None
+    _engine_pid = None
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def get_db_connection():
+    engine = get_engine()
+    start = time.perf_counter()
+    conn = engine.connect()
+    waited = time.perf_counter() - start
+    with _wait_lock:
+        _wait_stats['count'] += 1
+        _wait_stats['total_seconds'] += waited
+        if waited > _wait_stats['max_seconds']:
+            _wait_stats['max_seconds'] = waited
+    return conn
+
+
+def get_pool_stats():
+    pool = get_engine().pool
+    with _wait_lock:
+        waits = dict(_wait_stats)
+    stats = {
+        'pool_class': type(pool).__name__,
+        'size': pool.size() if hasattr(pool, 'size') else None,
+        'checked_out': pool.checkedout() if hasattr(pool, 'checkedout') else None,
+        'checked_in': pool.checkedin() if hasattr(pool, 'checkedin') else None,
+        'overflow': pool.overflow() if hasattr(pool, 'overflow') else None,
+        'connects': waits['count'],
+        'wait_seconds_total': round(waits['total_seconds'], 6),
+        'wait_seconds_max': round(waits['max_seconds'], 6),
+        'wait_seconds_avg': round(waits['total_seconds'] / waits['count'], 6) if waits['count'] else 0.0,
+    }
+    return stats
@@ -0,0 +1,91 @@
+import os
+import json
+import threading
+import numpy as np
+from nlp_model import SPACY_MODEL
+
+# Destination embeddings are built offline by build_embeddings.py into an
+# L2-normalised float32 matrix plus a JSON sidecar listing the destination id
+# of every row. Workers memory-map the matrix (so the OS shares one copy
+# between them) and score candidates with a single matrix-vector product.
+EMBEDDINGS_PATH = os.environ.get(
+    "EMBEDDINGS_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "embeddings", "destinations.npy"))
+SEMANTIC_MIN_SCORE = float(os.environ.get("SEMANTIC_MIN_SCORE", 0.55))
+
+_state = {'loaded': False, 'matrix': None, 'meta': None, 'row_for_id': None}
+_positions_cache = {}
+_load_lock = threading.Lock()
+
+
+def metadata_path(matrix_path=EMBEDDINGS_PATH):
+    return os.path.splitext(matrix_path)[0] + ".json"
+
+
+def save_embeddings(matrix, ids, model_name, catalogue_version, matrix_path=EMBEDDINGS_PATH):
+    os.makedirs(os.path.dirname(matrix_path), exist_ok=True)
+    np.save(matrix_path, np.ascontiguousarray(matrix, dtype=np.float32))
+    with open(metadata_path(matrix_path), "w", encoding="utf-8") as f:
+        json.dump({'ids': list(ids), 'model': model_name, 'catalogue_version': catalogue_version,
+                   'dim': int(matrix.shape[1])}, f)
+
+
+def normalize(vector):
+    vector = np.asarray(vector, dtype=np.float32)
+    norm = float(np.linalg.norm(vector))
+    return vector / norm if norm else None
+
+
+def _load():
+    with _load_lock:
+        if _state['loaded']:
+            return
+        _state['loaded'] = True
+        if not os.path.exists(EMBEDDINGS_PATH):
+            print(f"No destination embeddings at {EMBEDDINGS_PATH}; semantic search is disabled.")
+            return
+        with open(metadata_path(), encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta.get('model') != SPACY_MODEL:
+            # Vectors from another model live in a different space even when the dimensions match.
+            print(f"Destination embeddings were built with '{meta.get('model')}' but SPACY_MODEL is "
+                  f"'{SPACY_MODEL}'; semantic search is disabled until build_embeddings.py is re-run.")
+            return
+        _state['matrix'] = np.load(EMBEDDINGS_PATH, mmap_mode="r")
+        _state['meta'] = meta
+        _state['row_for_id'] = {dest_id: row for row, dest_id in enumerate(meta['ids'])}
+        print(f"Memory-mapped {len(meta['ids'])} destination embeddings ({meta['dim']} dims, model {meta['model']}).")
+
+
+def is_available():
+    _load()
+    return _state['matrix'] is not None
+
+
+def _rows_for(snapshot):
+    """Embedding row for every snapshot position (-1 when a destination has no embedding yet)."""
+    rows = _positions_cache.get(snapshot.version)
+    if rows is None:
+        row_for_id = _state['row_for_id']
+        rows = np.array([row_for_id.get(d.id, -1) for d in snapshot.destinations], dtype=np.int64)
+        _positions_cache.clear()
+        _positions_cache[snapshot.version] = rows
+    return rows
+
+
+def semantic_scores(snapshot, positions, query_vector):
+    """Cosine similarity of ``query_vector`` to each candidate position, as ``{position: score}``.
+
+    Only candidates at or above SEMANTIC_MIN_SCORE are returned.
+    """
+    if not positions or query_vector is None or not is_available():
+        return {}
+    matrix = _state['matrix']
+    if query_vector.shape[0] != matrix.shape[1]:
+        return {}
+
+    rows = _rows_for(snapshot)[positions]
+    present = rows >= 0
+    candidate_positions = np.asarray(positions)[present]
+    scores = matrix[rows[present]] @ query_vector
+    keep = scores >= SEMANTIC_MIN_SCORE
+    return dict(zip(candidate_positions[keep].tolist(), scores[keep].tolist()))
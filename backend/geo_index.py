@@ -0,0 +1,56 @@
+import math
+
+EARTH_RADIUS_KM = 6371.0088
+# Must match haversine_km's sphere, or points near the edge of the search
+# circle can fall outside the cells a query visits.
+KM_PER_DEGREE_LAT = math.pi * EARTH_RADIUS_KM / 180
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+class GridIndex:
+    """Buckets points into a fixed lat/lon grid for radius queries.
+
+    A query only visits the cells overlapping the search circle's bounding box
+    and measures exact great-circle distances for the points in them.
+    """
+
+    def __init__(self, items, cell_degrees=1.0):
+        self.cell_degrees = cell_degrees
+        self.lon_cells = int(math.ceil(360 / cell_degrees))
+        self.cells = {}
+        for item in items:
+            self.cells.setdefault(self._cell(item.lat, item.lon), []).append(item)
+
+    def _cell(self, lat, lon):
+        lon_index = int(math.floor((lon + 180) / self.cell_degrees)) % self.lon_cells
+        return int(math.floor((lat + 90) / self.cell_degrees)), lon_index
+
+    def within(self, lat, lon, radius_km, limit=None):
+        """Return ``[(distance_km, item), ...]`` within ``radius_km``, nearest first."""
+        lat_span = radius_km / KM_PER_DEGREE_LAT
+        min_lat_cell = int(math.floor((max(lat - lat_span, -90) + 90) / self.cell_degrees))
+        max_lat_cell = int(math.floor((min(lat + lat_span, 90) + 90) / self.cell_degrees))
+
+        cos_lat = math.cos(math.radians(min(abs(lat) + lat_span, 90)))
+        if cos_lat < 1e-6 or radius_km / (KM_PER_DEGREE_LAT * cos_lat) >= 180:
+            lon_indexes = range(self.lon_cells)
+        else:
+            lon_span = radius_km / (KM_PER_DEGREE_LAT * cos_lat)
+            first = int(math.floor((lon - lon_span + 180) / self.cell_degrees))
+            last = int(math.floor((lon + lon_span + 180) / self.cell_degrees))
+            lon_indexes = sorted({index % self.lon_cells for index in range(first, last + 1)})
+
+        matches = []
+        for lat_index in range(min_lat_cell, max_lat_cell + 1):
+            for lon_index in lon_indexes:
+                for item in self.cells.get((lat_index, lon_index), ()):
+                    distance = haversine_km(lat, lon, item.lat, item.lon)
+                    if distance <= radius_km:
+                        matches.append((distance, item))
+        matches.sort(key=lambda match: match[0])
+        return matches[:limit] if limit else matches
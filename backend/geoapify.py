@@ -0,0 +1,81 @@
+import os
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from instrumentation import ENABLED as METRICS_ENABLED, increment, timed
+
+GEOAPIFY_API_KEY = os.getenv("GEOAPIFY_API_KEY")
+GEOAPIFY_PLACES_URL = os.environ.get("GEOAPIFY_PLACES_URL", "https://api.geoapify.com/v2/places")
+
+# One keep-alive session per process so TLS connections to Geoapify are reused
+# across requests. Without timeouts a hung upstream would block a worker forever.
+HTTP_POOL_MAXSIZE = int(os.environ.get("GEOAPIFY_POOL_MAXSIZE", 10))
+HTTP_CONNECT_TIMEOUT = float(os.environ.get("GEOAPIFY_CONNECT_TIMEOUT", 3.05))
+HTTP_READ_TIMEOUT = float(os.environ.get("GEOAPIFY_READ_TIMEOUT", 5))
+HTTP_RETRIES = int(os.environ.get("GEOAPIFY_RETRIES", 3))
+HTTP_BACKOFF_FACTOR = float(os.environ.get("GEOAPIFY_BACKOFF_FACTOR", 0.5))
+
+_session = None
+_session_pid = None
+_session_lock = threading.Lock()
+_request_stats = {'requests': 0, 'failures': 0}
+_stats_lock = threading.Lock()
+
+
+def _create_session():
+    session = requests.Session()
+    retry = Retry(total=HTTP_RETRIES, backoff_factor=HTTP_BACKOFF_FACTOR, status_forcelist=[500, 502, 503, 504])
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_MAXSIZE, max_retries=retry)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def get_session():
+    global _session, _session_pid
+    pid = os.getpid()
+    if _session is None or _session_pid != pid:
+        with _session_lock:
+            if _session is None or _session_pid != pid:
+                _session = _create_session()
+                _session_pid = pid
+    return _session
+
+
+@timed('geoapify')
+def request_venues(lon, lat, categories, limit=10):
+    """Query Geoapify Places, raising requests.exceptions.RequestException on failure."""
+    places_url = f"{GEOAPIFY_PLACES_URL}?categories={categories}&filter=circle:{lon},{lat},15000&bias=proximity:{lon},{lat}&limit={limit}&apiKey={GEOAPIFY_API_KEY}"
+    with _stats_lock:
+        _request_stats['requests'] += 1
+
+    try:
+        response = get_session().get(places_url, timeout=(HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT))
+        if METRICS_ENABLED and response.raw is not None and response.raw.retries is not None:
+            increment('geoapify_retries_total', amount=len(response.raw.retries.history))
+        response.raise_for_status() # Raise an exception for bad status codes
+        features = response.json().get('features', [])
+    except requests.exceptions.RequestException:
+        with _stats_lock:
+            _request_stats['failures'] += 1
+        raise
+    venues = [{'id': prop.get('place_id'),'name': prop.get('name'),'address': prop.get('address_line2', 'Address not available'),'lon': coords[0],'lat': coords[1]} for venue in features if (prop := venue.get('properties', {})) and (coords := venue.get('geometry', {}).get('coordinates')) and prop.get('name')]
+    return venues
+
+
+def get_http_stats():
+    with _stats_lock:
+        stats = dict(_request_stats)
+    stats.update({'connections_opened': 0, 'pool_requests': 0, 'connections_reused': 0})
+    if _session is not None and _session_pid == os.getpid():
+        adapter = _session.get_adapter('https://')
+        pools = adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            stats['connections_opened'] += pool.num_connections
+            stats['pool_requests'] += pool.num_requests
+        stats['connections_reused'] = max(stats['pool_requests'] - stats['connections_opened'], 0)
+    return stats
@@ -0,0 +1,37 @@
+# Picked up automatically by `gunicorn app:app` (see Procfile).
+import os
+
+# "sync" blocks a worker for the whole Geoapify round trip or database wait.
+# "gevent" runs each request in a greenlet: requests/urllib3 sockets are
+# monkey-patched and psycopg2 is made cooperative below, so one worker can
+# serve many I/O-bound requests at once. The worker count comes from
+# WEB_CONCURRENCY, which gunicorn reads natively.
+worker_class = os.environ.get("GUNICORN_WORKER_CLASS", "sync")
+worker_connections = int(os.environ.get("GUNICORN_WORKER_CONNECTIONS", 100))
+
+
+def post_fork(server, worker):
+    if "gevent" in server.cfg.worker_class_str:
+        # Patch before any app module is imported so the locks and connection
+        # pools they create at import time are greenlet-aware. The worker
+        # repeats patch_all() itself later, which is a no-op.
+        from gevent import monkey
+        monkey.patch_all()
+        from psycogreen.gevent import patch_psycopg
+        patch_psycopg()
+
+    # Load the language model as each worker boots so the first /api/chat
+    # request does not pay for it.
+    import nlp_model
+    try:
+        nlp_model.load_model()
+    except IOError:
+        server.log.error("SpaCy model not found; /api/chat will be unavailable.")
+
+    # Build this worker's in-memory catalogue before it takes traffic.
+    from db import get_db_connection
+    from catalogue_snapshot import get_snapshot
+    try:
+        get_snapshot(get_db_connection)
+    except Exception as e:
+        server.log.error(f"Could not preload the destination catalogue: {e}")
@@ -0,0 +1,203 @@
+import os
+import time
+import threading
+import functools
+import contextlib
+import contextvars
+
+# Per-worker latency histograms rendered in Prometheus text format by
+# /api/metrics. Requests are timed as a whole, and spans time the pieces inside
+# them (spaCy, SQL, Geoapify, bcrypt, JSON) under the endpoint that ran them.
+# With METRICS_ENABLED off, timed() returns functions unchanged, span() hands
+# back a shared no-op, and no request hooks or engine listeners are installed.
+ENABLED = os.environ.get("METRICS_ENABLED", "false").lower() in ("1", "true", "yes")
+METRIC_PREFIX = "escapegenie_"
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_current_endpoint = contextvars.ContextVar("metrics_endpoint", default="none")
+_histograms = {}
+_counters = {}
+_lock = threading.Lock()
+_NULL_SPAN = contextlib.nullcontext()
+
+HELP = {
+    "http_request_duration_seconds": "Time spent handling a request, by Flask endpoint.",
+    "http_requests_total": "Requests handled, by Flask endpoint and status code.",
+    "span_duration_seconds": "Time spent in an instrumented operation, by endpoint and span.",
+    "geoapify_retries_total": "Geoapify request retries that ended in a response.",
+}
+
+
+class Histogram:
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self):
+        self.counts = [0] * len(LATENCY_BUCKETS)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        self.sum += value
+        self.count += 1
+
+
+def observe(name, labels, seconds):
+    """Add ``seconds`` to the histogram ``name`` with ``labels`` (a tuple of pairs)."""
+    key = (name, labels)
+    with _lock:
+        histogram = _histograms.get(key)
+        if histogram is None:
+            histogram = _histograms[key] = Histogram()
+        histogram.observe(seconds)
+
+
+def increment(name, labels=(), amount=1):
+    key = (name, labels)
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + amount
+
+
+class _Span:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        record_span(self.name, time.perf_counter() - self.start)
+        return False
+
+
+def record_span(name, seconds):
+    observe("span_duration_seconds", (("endpoint", _current_endpoint.get()), ("span", name)), seconds)
+
+
+def span(name):
+    """Context manager timing a block as span ``name`` of the current endpoint."""
+    return _Span(name) if ENABLED else _NULL_SPAN
+
+
+def timed(name):
+    """Decorator form of span(); a no-op when metrics are disabled."""
+    def decorator(fn):
+        if not ENABLED:
+            return fn
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with _Span(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def bind(fn):
+    """Carry the current endpoint into ``fn`` when it runs on an executor thread."""
+    if not ENABLED:
+        return fn
+    return functools.partial(contextvars.copy_context().run, fn)
+
+
+def instrument_app(app):
+    """Time every request and JSON serialisation of ``app`` when metrics are enabled."""
+    if not ENABLED:
+        return
+    from flask import g, request
+
+    @app.before_request
+    def start_request_timer():
+        g.metrics_start = time.perf_counter()
+        g.metrics_token = _current_endpoint.set(request.endpoint or "unmatched")
+
+    @app.after_request
+    def record_request(response):
+        start = g.pop("metrics_start", None)
+        if start is not None:
+            endpoint = request.endpoint or "unmatched"
+            observe("http_request_duration_seconds", (("endpoint", endpoint), ("method", request.method)),
+                    time.perf_counter() - start)
+            increment("http_requests_total", (("endpoint", endpoint), ("method", request.method),
+                                              ("status", str(response.status_code))))
+        return response
+
+    @app.teardown_request
+    def reset_endpoint(exc):
+        token = g.pop("metrics_token", None)
+        if token is not None:
+            _current_endpoint.reset(token)
+
+    provider = app.json
+    for name in ("dumps", "dumps_bytes"):
+        if hasattr(provider, name):
+            setattr(provider, name, _timed_method(getattr(provider, name), "serialize"))
+
+
+def _timed_method(method, span_name):
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        with _Span(span_name):
+            return method(*args, **kwargs)
+    return wrapper
+
+
+def instrument_engine(engine):
+    """Time every statement run through ``engine`` as an "sql" span."""
+    if not ENABLED:
+        return
+    from sqlalchemy import event
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def start_query_timer(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("metrics_query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def record_query(conn, cursor, statement, parameters, context, executemany):
+        record_span("sql", time.perf_counter() - conn.info["metrics_query_start"].pop())
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels, extra=()):
+    pairs = list(labels) + list(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in pairs) + "}"
+
+
+def render_prometheus():
+    """This worker's metrics in the Prometheus text exposition format."""
+    with _lock:
+        histograms = {key: (list(h.counts), h.sum, h.count) for key, h in _histograms.items()}
+        counters = dict(_counters)
+
+    lines = []
+    for metric_type, series in (("histogram", histograms), ("counter", counters)):
+        for name in sorted({name for name, _ in series}):
+            full_name = METRIC_PREFIX + name
+            lines.append(f"# HELP {full_name} {HELP.get(name, name)}")
+            lines.append(f"# TYPE {full_name} {metric_type}")
+            for (series_name, labels), value in sorted(series.items()):
+                if series_name != name:
+                    continue
+                if metric_type == "counter":
+                    lines.append(f"{full_name}{_format_labels(labels)} {value}")
+                    continue
+                counts, total, count = value
+                cumulative = 0
+                for bound, bucket_count in zip(LATENCY_BUCKETS, counts):
+                    cumulative += bucket_count
+                    lines.append(f"{full_name}_bucket{_format_labels(labels, [('le', bound)])} {cumulative}")
+                lines.append(f"{full_name}_bucket{_format_labels(labels, [('le', '+Inf')])} {count}")
+                lines.append(f"{full_name}_sum{_format_labels(labels)} {total}")
+                lines.append(f"{full_name}_count{_format_labels(labels)} {count}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,73 @@
+import sqlalchemy
+from dotenv import load_dotenv
+
+# Schema changes applied on top of the tables created by create_db.py.
+# Every migration is recorded in schema_migrations once it has run, and every
+# statement is safe to repeat, so this can be run against a live database at
+# any time: `python migrations.py`.
+MIGRATIONS = [
+    (1, "index landmarks by destination", [
+        "CREATE INDEX IF NOT EXISTS idx_landmarks_destination_id ON landmarks (destination_id)",
+    ]),
+    (2, "unique saved destination per user", [
+        # Drop duplicate saves left by the old check-then-insert path before enforcing uniqueness.
+        """DELETE FROM saved_destinations WHERE id NOT IN (
+            SELECT MIN(id) FROM saved_destinations GROUP BY user_id, destination_id
+        )""",
+        "CREATE UNIQUE INDEX IF NOT EXISTS uq_saved_destinations_user_destination ON saved_destinations (user_id, destination_id)",
+    ]),
+    (3, "index reviews by destination and recency", [
+        "CREATE INDEX IF NOT EXISTS idx_reviews_destination_timestamp_id ON reviews (destination_id, timestamp DESC, id DESC)",
+        "CREATE INDEX IF NOT EXISTS idx_reviews_user_id ON reviews (user_id)",
+    ]),
+    (4, "per-destination review summary", [
+        """CREATE TABLE IF NOT EXISTS review_stats (
+            destination_id TEXT PRIMARY KEY REFERENCES destinations (id),
+            review_count INTEGER NOT NULL DEFAULT 0, rating_sum INTEGER NOT NULL DEFAULT 0,
+            rating_1 INTEGER NOT NULL DEFAULT 0, rating_2 INTEGER NOT NULL DEFAULT 0, rating_3 INTEGER NOT NULL DEFAULT 0,
+            rating_4 INTEGER NOT NULL DEFAULT 0, rating_5 INTEGER NOT NULL DEFAULT 0
+        )""",
+        "DELETE FROM review_stats",
+        """INSERT INTO review_stats (destination_id, review_count, rating_sum, rating_1, rating_2, rating_3, rating_4, rating_5)
+        SELECT destination_id, COUNT(*), SUM(rating),
+            SUM(CASE WHEN rating = 1 THEN 1 ELSE 0 END), SUM(CASE WHEN rating = 2 THEN 1 ELSE 0 END),
+            SUM(CASE WHEN rating = 3 THEN 1 ELSE 0 END), SUM(CASE WHEN rating = 4 THEN 1 ELSE 0 END),
+            SUM(CASE WHEN rating = 5 THEN 1 ELSE 0 END)
+        FROM reviews GROUP BY destination_id""",
+    ]),
+    (5, "natural key for landmarks", [
+        """DELETE FROM landmarks WHERE id NOT IN (
+            SELECT MIN(id) FROM landmarks GROUP BY destination_id, name
+        )""",
+        "CREATE UNIQUE INDEX IF NOT EXISTS uq_landmarks_destination_name ON landmarks (destination_id, name)",
+    ]),
+]
+
+
+def apply_migrations(conn):
+    """Apply pending migrations on ``conn`` inside the caller's transaction. Returns the versions applied."""
+    conn.execute(sqlalchemy.text('''
+    CREATE TABLE IF NOT EXISTS schema_migrations (
+        version INTEGER PRIMARY KEY, name TEXT NOT NULL, applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )'''))
+    applied = {row[0] for row in conn.execute(sqlalchemy.text("SELECT version FROM schema_migrations"))}
+
+    newly_applied = []
+    for version, name, statements in MIGRATIONS:
+        if version in applied:
+            continue
+        for statement in statements:
+            conn.execute(sqlalchemy.text(statement))
+        conn.execute(sqlalchemy.text("INSERT INTO schema_migrations (version, name) VALUES (:version, :name)"),
+                     {'version': version, 'name': name})
+        print(f"Applied migration {version}: {name}")
+        newly_applied.append(version)
+    return newly_applied
+
+
+if __name__ == '__main__':
+    load_dotenv()
+    from db import get_engine
+    with get_engine().begin() as conn:
+        versions = apply_migrations(conn)
+    print(f"Applied {len(versions)} migration(s)." if versions else "Database schema is up to date.")
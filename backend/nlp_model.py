@@ -0,0 +1,69 @@
+import os
+import time
+import threading
+import spacy
+from instrumentation import timed
+
+# Only token.lemma_ is used by /api/chat. The English lemmatizer needs POS tags
+# from tok2vec/tagger/attribute_ruler, but the parser and NER can be left out.
+SPACY_MODEL = os.environ.get("SPACY_MODEL", "en_core_web_sm")
+EXCLUDED_PIPES = ["parser", "ner", "senter"]
+WARMUP_TEXT = "a relaxing beach holiday with mountains, history and great food"
+
+_nlp = None
+_load_lock = threading.Lock()
+_stats = {'load_seconds': None, 'docs': 0, 'doc_seconds_total': 0.0, 'doc_seconds_max': 0.0}
+_stats_lock = threading.Lock()
+
+
+def load_model():
+    """Load, trim and warm up the spaCy pipeline once per process."""
+    global _nlp
+    if _nlp is not None:
+        return _nlp
+
+    with _load_lock:
+        if _nlp is None:
+            start = time.perf_counter()
+            print(f"Loading SpaCy model '{SPACY_MODEL}'...")
+            model = spacy.load(SPACY_MODEL, exclude=EXCLUDED_PIPES)
+            model(WARMUP_TEXT)
+            elapsed = time.perf_counter() - start
+            _stats['load_seconds'] = round(elapsed, 3)
+            print(f"SpaCy model loaded in {elapsed:.2f}s with pipes: {', '.join(model.pipe_names)}")
+            _nlp = model
+    return _nlp
+
+
+def has_static_vectors(nlp=None):
+    """True when the pipeline ships word vectors.
+
+    doc.has_vector alone is not enough: pipelines without vectors fall back to
+    the mean of the tok2vec tensor, which is not a meaningful similarity space.
+    """
+    nlp = nlp if nlp is not None else load_model()
+    return nlp.vocab.vectors.size > 0
+
+
+@timed('nlp')
+def process(text):
+    doc_start = time.perf_counter()
+    doc = load_model()(text)
+    elapsed = time.perf_counter() - doc_start
+    with _stats_lock:
+        _stats['docs'] += 1
+        _stats['doc_seconds_total'] += elapsed
+        if elapsed > _stats['doc_seconds_max']:
+            _stats['doc_seconds_max'] = elapsed
+    return doc
+
+
+def get_nlp_stats():
+    with _stats_lock:
+        stats = dict(_stats)
+    stats['loaded'] = _nlp is not None
+    stats['pipes'] = list(_nlp.pipe_names) if _nlp is not None else []
+    stats['doc_seconds_avg'] = round(stats['doc_seconds_total'] / stats['docs'], 6) if stats['docs'] else 0.0
+    stats['doc_seconds_total'] = round(stats['doc_seconds_total'], 6)
+    stats['doc_seconds_max'] = round(stats['doc_seconds_max'], 6)
+    return stats
@@ -0,0 +1,162 @@
+import os
+import time
+import threading
+import multiprocessing
+import concurrent.futures
+from concurrent.futures.process import BrokenProcessPool
+import bcrypt
+from instrumentation import timed
+
+# bcrypt is deliberately slow CPU work (~250 ms at cost 12). It runs in a small
+# process pool per worker so a burst of logins cannot hold the GIL and stall
+# every other request the worker is serving. Hashes are compatible with the
+# ones flask-bcrypt wrote, and logins rehash stored passwords whose cost
+# differs from BCRYPT_ROUNDS.
+BCRYPT_ROUNDS = int(os.environ.get("BCRYPT_ROUNDS", 12))
+POOL_WORKERS = int(os.environ.get("BCRYPT_POOL_WORKERS", 2))
+MAX_PENDING = int(os.environ.get("BCRYPT_MAX_PENDING", 32))
+TIMEOUT_SECONDS = float(os.environ.get("BCRYPT_TIMEOUT_SECONDS", 10))
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when the hashing pool is saturated or a job outlives BCRYPT_TIMEOUT_SECONDS."""
+
+
+_pool = None
+_pool_pid = None
+_pool_lock = threading.Lock()
+_pending = threading.BoundedSemaphore(MAX_PENDING)
+
+_stats = {op: {'count': 0, 'total_seconds': 0.0, 'max_seconds': 0.0} for op in ('hash', 'check')}
+_stats.update(rehashed=0, rejected_busy=0)
+_stats_lock = threading.Lock()
+
+
+def _hash(password, rounds):
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds)).decode('utf-8')
+
+
+def _check(hashed, password):
+    try:
+        return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
+    except ValueError:
+        # Not a bcrypt hash at all.
+        return False
+
+
+def _get_pool():
+    global _pool, _pool_pid
+    pid = os.getpid()
+    if _pool is not None and _pool_pid == pid:
+        return _pool
+    with _pool_lock:
+        if _pool is None or _pool_pid != pid:
+            # forkserver children start from a clean process instead of a copy
+            # of a worker that already has threads and open sockets.
+            method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+            _pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=POOL_WORKERS, mp_context=multiprocessing.get_context(method))
+            _pool_pid = pid
+    return _pool
+
+
+def _reset_pool(broken):
+    global _pool
+    with _pool_lock:
+        if _pool is broken:
+            _pool = None
+    broken.shutdown(wait=False)
+
+
+def _acquire_slot():
+    if not _pending.acquire(blocking=False):
+        with _stats_lock:
+            _stats['rejected_busy'] += 1
+        raise PasswordHasherBusy(f"{MAX_PENDING} password operations already queued")
+
+
+def _release_slot(future=None):
+    _pending.release()
+
+
+def _submit(pool, fn, args):
+    """Queue ``fn`` on ``pool``. Its slot is freed when the job finishes, even if the caller gave up waiting."""
+    _acquire_slot()
+    try:
+        future = pool.submit(fn, *args)
+    except BaseException:
+        _release_slot()
+        raise
+    future.add_done_callback(_release_slot)
+    return future
+
+
+def _run_in_pool(op, fn, args):
+    for attempt in (1, 2):
+        pool = _get_pool()
+        try:
+            return _submit(pool, fn, args).result(timeout=TIMEOUT_SECONDS)
+        except BrokenProcessPool:
+            # A pool process died; start a fresh pool and try once more.
+            _reset_pool(pool)
+    raise PasswordHasherBusy(f"Password {op} failed: the hashing pool keeps crashing")
+
+
+def _run(op, fn, *args):
+    start = time.perf_counter()
+    if POOL_WORKERS <= 0:
+        _acquire_slot()
+        try:
+            result = fn(*args)
+        finally:
+            _release_slot()
+    else:
+        try:
+            result = _run_in_pool(op, fn, args)
+        except concurrent.futures.TimeoutError:
+            raise PasswordHasherBusy(f"Password {op} took longer than {TIMEOUT_SECONDS}s")
+
+    elapsed = time.perf_counter() - start
+    with _stats_lock:
+        stats = _stats[op]
+        stats['count'] += 1
+        stats['total_seconds'] += elapsed
+        if elapsed > stats['max_seconds']:
+            stats['max_seconds'] = elapsed
+    return result
+
+
+@timed('bcrypt_hash')
+def hash_password(password):
+    return _run('hash', _hash, password, BCRYPT_ROUNDS)
+
+
+@timed('bcrypt_check')
+def check_password(hashed, password):
+    return _run('check', _check, hashed, password)
+
+
+def needs_rehash(hashed):
+    """True when ``hashed`` was made with a different cost than BCRYPT_ROUNDS."""
+    try:
+        return int(hashed.split('$')[2]) != BCRYPT_ROUNDS
+    except (IndexError, ValueError):
+        return True
+
+
+def record_rehash():
+    with _stats_lock:
+        _stats['rehashed'] += 1
+
+
+def get_password_stats():
+    with _stats_lock:
+        stats = {op: dict(_stats[op]) for op in ('hash', 'check')}
+        stats.update(rehashed=_stats['rehashed'], rejected_busy=_stats['rejected_busy'])
+    for op in ('hash', 'check'):
+        op_stats = stats[op]
+        op_stats['avg_seconds'] = round(op_stats['total_seconds'] / op_stats['count'], 6) if op_stats['count'] else 0.0
+        op_stats['total_seconds'] = round(op_stats['total_seconds'], 6)
+        op_stats['max_seconds'] = round(op_stats['max_seconds'], 6)
+    stats.update(rounds=BCRYPT_ROUNDS, pool_workers=POOL_WORKERS, max_pending=MAX_PENDING)
+    return stats
@@ -0,0 +1,144 @@
+import os
+import re
+import time
+import threading
+from sqlalchemy import event
+
+# Every statement is timed and folded into per-fingerprint totals (literals and
+# IN-list lengths stripped, so queries that only differ in their values share a
+# row). Statements slower than SLOW_QUERY_MS are printed with their query plan,
+# captured at most once per fingerprint every EXPLAIN_INTERVAL_SECONDS.
+# Parameter values are never logged, only how many there were.
+ENABLED = os.environ.get("QUERY_LOG_ENABLED", "true").lower() in ("1", "true", "yes")
+SLOW_QUERY_MS = float(os.environ.get("SLOW_QUERY_MS", 200))
+EXPLAIN_INTERVAL_SECONDS = float(os.environ.get("SLOW_QUERY_EXPLAIN_INTERVAL", 300))
+TOP_N = int(os.environ.get("QUERY_STATS_TOP_N", 20))
+MAX_FINGERPRINTS = 1000
+
+_WHITESPACE = re.compile(r"\s+")
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w$])-?\d+(?:\.\d+)?\b")
+_NAMED_PARAM = re.compile(r"%\(\w+\)s|:\w+|\$\d+|%s")
+_IN_LIST = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+
+_fingerprints = {}
+_stats = {}
+_lock = threading.Lock()
+
+
+def fingerprint(statement):
+    cached = _fingerprints.get(statement)
+    if cached is not None:
+        return cached
+    text = _WHITESPACE.sub(" ", statement).strip()
+    text = _STRING_LITERAL.sub("?", text)
+    text = _NAMED_PARAM.sub("?", text)
+    text = _NUMBER_LITERAL.sub("?", text)
+    text = _IN_LIST.sub("IN (...)", text)
+    if len(_fingerprints) < MAX_FINGERPRINTS * 4:
+        _fingerprints[statement] = text
+    return text
+
+
+def _param_count(parameters, executemany):
+    if executemany:
+        return sum(len(row) for row in parameters)
+    return len(parameters) if parameters else 0
+
+
+def _explain(conn, statement, parameters):
+    """Return the query plan for ``statement`` as text, without disturbing the transaction."""
+    dialect = conn.dialect.name
+    prefix = "EXPLAIN QUERY PLAN " if dialect == "sqlite" else "EXPLAIN "
+    cursor = conn.connection.cursor()
+    savepoint = dialect == "postgresql"
+    try:
+        if savepoint:
+            cursor.execute("SAVEPOINT query_log_explain")
+        try:
+            cursor.execute(prefix + statement, parameters)
+            rows = cursor.fetchall()
+        except Exception as e:
+            if savepoint:
+                cursor.execute("ROLLBACK TO SAVEPOINT query_log_explain")
+            return f"(EXPLAIN failed: {e})"
+        finally:
+            if savepoint:
+                cursor.execute("RELEASE SAVEPOINT query_log_explain")
+    finally:
+        cursor.close()
+    # SQLite rows are (id, parent, notused, detail); Postgres rows are one text column.
+    return "\n".join(str(row[-1]) for row in rows)
+
+
+def _record(conn, statement, parameters, executemany, rowcount, elapsed):
+    key = fingerprint(statement)
+    now = time.monotonic()
+    with _lock:
+        entry = _stats.get(key)
+        if entry is None:
+            if len(_stats) >= MAX_FINGERPRINTS:
+                # Make room by forgetting the cheapest fingerprint seen so far.
+                del _stats[min(_stats, key=lambda k: _stats[k]['total_seconds'])]
+            entry = _stats[key] = {'count': 0, 'total_seconds': 0.0, 'max_seconds': 0.0, 'rows': 0,
+                                   'params': 0, 'slow': 0, 'plan': None, 'explained_at': None}
+        entry['count'] += 1
+        entry['total_seconds'] += elapsed
+        entry['max_seconds'] = max(entry['max_seconds'], elapsed)
+        entry['params'] = _param_count(parameters, executemany)
+        if rowcount is not None and rowcount >= 0:
+            entry['rows'] += rowcount
+        slow = elapsed * 1000 >= SLOW_QUERY_MS
+        explain = slow and not executemany and (
+            entry['explained_at'] is None or now - entry['explained_at'] >= EXPLAIN_INTERVAL_SECONDS)
+        if slow:
+            entry['slow'] += 1
+        if explain:
+            entry['explained_at'] = now
+
+    if not slow:
+        return
+    rows = rowcount if rowcount is not None and rowcount >= 0 else "?"
+    message = f"Slow query ({elapsed * 1000:.1f} ms, {entry['params']} params, {rows} rows): {key}"
+    if explain:
+        plan = _explain(conn, statement, parameters)
+        with _lock:
+            entry['plan'] = plan
+        message += "\n" + plan
+    print(message)
+
+
+def attach_query_log(engine):
+    """Time every statement run through ``engine`` and log the slow ones."""
+    if not ENABLED:
+        return
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def start_query_timer(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_log_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def record_query(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_log_start"].pop()
+        _record(conn, statement, parameters, executemany, cursor.rowcount, elapsed)
+
+
+def get_query_stats(limit=TOP_N):
+    """The ``limit`` fingerprints with the most total execution time."""
+    with _lock:
+        entries = [(key, dict(entry)) for key, entry in _stats.items()]
+    entries.sort(key=lambda item: item[1]['total_seconds'], reverse=True)
+    top = []
+    for key, entry in entries[:limit]:
+        top.append({
+            'fingerprint': key,
+            'count': entry['count'],
+            'total_seconds': round(entry['total_seconds'], 6),
+            'avg_seconds': round(entry['total_seconds'] / entry['count'], 6),
+            'max_seconds': round(entry['max_seconds'], 6),
+            'rows': entry['rows'],
+            'params': entry['params'],
+            'slow': entry['slow'],
+            'plan': entry['plan'],
+        })
+    return {'enabled': ENABLED, 'slow_query_ms': SLOW_QUERY_MS, 'fingerprints': len(entries), 'top': top}
@@ -0,0 +1,89 @@
+import re
+import math
+import heapq
+
+# Destinations that pass the tag filters are ranked by:
+#   TAG_WEIGHT  * number of search terms found in the destination's tags
+# + BM25_WEIGHT * BM25 score of the search terms against its description
+# + COST_WEIGHT when the message asks for a price level (e.g. "cheap", "luxury")
+#   and the destination's cost_tier matches it
+# + SEMANTIC_WEIGHT * cosine similarity of the message to the destination's
+#   precomputed embedding, when semantic search is available.
+# Everything that does not depend on the query is computed once per catalogue
+# snapshot, so scoring a request is a few dict lookups per candidate.
+TAG_WEIGHT = 2.0
+BM25_WEIGHT = 1.0
+COST_WEIGHT = 1.5
+SEMANTIC_WEIGHT = 3.0
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+COST_TERMS = {
+    "cheap": "budget", "budget": "budget", "affordable": "budget", "backpacking": "budget",
+    "luxury": "luxury", "luxurious": "luxury", "upscale": "luxury", "lavish": "luxury",
+}
+WORD_RE = re.compile(r"[a-z]+")
+
+
+def normalize_word(word):
+    """Cheap plural folding so description words line up with lemmatised search terms."""
+    if len(word) > 4 and word.endswith("ies"):
+        return word[:-3] + "y"
+    if len(word) > 4 and word.endswith("es") and word[:-2].endswith(("s", "x", "ch", "sh")):
+        return word[:-2]
+    if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+        return word[:-1]
+    return word
+
+
+def tokenize(text):
+    return [normalize_word(word) for word in WORD_RE.findall((text or "").lower())]
+
+
+class DestinationRanker:
+    """Scores destinations (given by position in the snapshot) against a set of search terms."""
+
+    def __init__(self, destinations):
+        self.tags = [frozenset(tag.strip() for tag in d.tags.split(",")) for d in destinations]
+        self.cost_tiers = [d.cost_tier for d in destinations]
+
+        documents = [tokenize(d.description) for d in destinations]
+        doc_count = len(documents) or 1
+        avg_length = sum(len(doc) for doc in documents) / doc_count or 1.0
+        doc_freq = {}
+        for doc in documents:
+            for term in set(doc):
+                doc_freq[term] = doc_freq.get(term, 0) + 1
+
+        self.bm25 = []
+        for doc in documents:
+            term_freq = {}
+            for term in doc:
+                term_freq[term] = term_freq.get(term, 0) + 1
+            length_norm = BM25_K1 * (1 - BM25_B + BM25_B * len(doc) / avg_length)
+            self.bm25.append({
+                term: math.log(1 + (doc_count - doc_freq[term] + 0.5) / (doc_freq[term] + 0.5))
+                      * tf * (BM25_K1 + 1) / (tf + length_norm)
+                for term, tf in term_freq.items()
+            })
+
+    def score(self, position, search_terms, wanted_tier=None, semantic_scores=None):
+        weights = self.bm25[position]
+        score = TAG_WEIGHT * len(self.tags[position].intersection(search_terms))
+        score += BM25_WEIGHT * sum(weights.get(normalize_word(term), 0.0) for term in search_terms)
+        if wanted_tier and self.cost_tiers[position] == wanted_tier:
+            score += COST_WEIGHT
+        if semantic_scores:
+            score += SEMANTIC_WEIGHT * semantic_scores.get(position, 0.0)
+        return score
+
+    def top_k(self, positions, search_terms, budget="any", k=30, semantic_scores=None):
+        """Return the ``k`` best positions, best first; ties keep the incoming (name) order."""
+        wanted_tier = None
+        if budget == "any":
+            tiers = {COST_TERMS[term] for term in search_terms if term in COST_TERMS}
+            wanted_tier = tiers.pop() if len(tiers) == 1 else None
+        if not search_terms and wanted_tier is None and not semantic_scores:
+            return list(positions)[:k]
+        scored = ((self.score(position, search_terms, wanted_tier, semantic_scores), -position) for position in positions)
+        return [-negative_position for _, negative_position in heapq.nlargest(k, scored)]
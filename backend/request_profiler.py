@@ -0,0 +1,215 @@
+import os
+import re
+import sys
+import time
+import hmac
+import threading
+import collections
+
+# On-demand wall-clock sampling of a single request. A request carrying
+# "X-Profile: <PROFILER_TOKEN>" is sampled every PROFILER_INTERVAL_MS; the
+# stacks of its thread (and of helper threads whose names start with one of the
+# prefixes given to attach_profiler) are written in collapsed "a;b;c count"
+# form, which flamegraph.pl and speedscope read directly. Nothing runs unless
+# PROFILER_TOKEN is set, at most one request per worker is profiled at a time,
+# and a token bucket caps how many start per minute.
+PROFILER_TOKEN = os.environ.get("PROFILER_TOKEN")
+PROFILE_HEADER = "X-Profile"
+INTERVAL_SECONDS = float(os.environ.get("PROFILER_INTERVAL_MS", 5)) / 1000
+MAX_PER_MINUTE = float(os.environ.get("PROFILER_MAX_PER_MINUTE", 6))
+MAX_SECONDS = float(os.environ.get("PROFILER_MAX_SECONDS", 30))
+PROFILE_DIR = os.environ.get("PROFILER_DIR", "profiles")
+KEEP_PROFILES = int(os.environ.get("PROFILER_KEEP", 50))
+PROFILE_ID = re.compile(r"^[\w.-]+\.folded$")
+_UNSAFE_CHARS = re.compile(r"[^\w-]")
+
+_active = threading.Lock()
+_bucket = {'tokens': MAX_PER_MINUTE, 'updated': time.monotonic()}
+_bucket_lock = threading.Lock()
+_stats = {'profiled': 0, 'rate_limited': 0, 'busy': 0}
+_stats_lock = threading.Lock()
+
+
+def _count(name):
+    with _stats_lock:
+        _stats[name] += 1
+
+
+def is_authorized(value):
+    # compare_digest only accepts ASCII str, so compare the UTF-8 bytes instead.
+    return bool(PROFILER_TOKEN) and value is not None and hmac.compare_digest(
+        value.encode('utf-8', 'surrogateescape'), PROFILER_TOKEN.encode('utf-8', 'surrogateescape'))
+
+
+def _take_token():
+    with _bucket_lock:
+        now = time.monotonic()
+        _bucket['tokens'] = min(MAX_PER_MINUTE, _bucket['tokens'] + (now - _bucket['updated']) * MAX_PER_MINUTE / 60)
+        _bucket['updated'] = now
+        if _bucket['tokens'] < 1:
+            allowed = False
+        else:
+            _bucket['tokens'] -= 1
+            allowed = True
+    if not allowed:
+        _count('rate_limited')
+    return allowed
+
+
+def _frame_label(frame):
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class Sampler(threading.Thread):
+    """Samples the stacks of ``thread_id`` and of threads named with ``thread_prefixes``."""
+
+    def __init__(self, thread_id, thread_prefixes=()):
+        super().__init__(name="request-profiler", daemon=True)
+        self.thread_id = thread_id
+        self.thread_prefixes = tuple(thread_prefixes)
+        self.counts = collections.Counter()
+        self.samples = 0
+        self.started = None
+        self._stop_event = threading.Event()
+
+    def _targets(self):
+        targets = {self.thread_id: "request"}
+        if self.thread_prefixes:
+            for thread in threading.enumerate():
+                if thread.name.startswith(self.thread_prefixes) and thread.ident is not None:
+                    targets[thread.ident] = thread.name
+        return targets
+
+    def sample(self):
+        frames = sys._current_frames()
+        for ident, label in self._targets().items():
+            frame = frames.get(ident)
+            stack = []
+            while frame is not None:
+                if frame.f_code.co_filename == __file__:
+                    # The thread is inside the profiler's own hooks; keep only their callers.
+                    stack = []
+                else:
+                    stack.append(_frame_label(frame))
+                frame = frame.f_back
+            if stack:
+                stack.append(label)
+                self.counts[";".join(reversed(stack))] += 1
+        self.samples += 1
+
+    def run(self):
+        self.started = time.perf_counter()
+        deadline = self.started + MAX_SECONDS
+        # Sample on entry too, so a request shorter than one interval still shows up.
+        self.sample()
+        while not self._stop_event.wait(INTERVAL_SECONDS) and time.perf_counter() < deadline:
+            self.sample()
+        if self._stop_event.is_set():
+            # One last sample of where the request ended up, taken from this
+            # thread rather than by stop() on the request's own stack.
+            self.sample()
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+        return time.perf_counter() - self.started
+
+    def collapsed(self):
+        return "".join(f"{stack} {count}\n" for stack, count in self.counts.most_common())
+
+
+def start_profile(thread_prefixes=()):
+    """Begin sampling the calling thread, or return ``(None, reason)`` if not allowed right now."""
+    if not _active.acquire(blocking=False):
+        _count('busy')
+        return None, "busy"
+    if not _take_token():
+        _active.release()
+        return None, "rate-limited"
+    sampler = Sampler(threading.get_ident(), thread_prefixes)
+    sampler.start()
+    return sampler, None
+
+
+def finish_profile(sampler, endpoint):
+    """Stop ``sampler``, write its collapsed stacks and return the profile id (None if it could not be saved)."""
+    try:
+        elapsed = sampler.stop()
+        profile_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-{_UNSAFE_CHARS.sub('_', endpoint)}.folded"
+        try:
+            os.makedirs(PROFILE_DIR, exist_ok=True)
+            with open(os.path.join(PROFILE_DIR, profile_id), "w") as f:
+                f.write(sampler.collapsed())
+            _prune()
+        except OSError as e:
+            print(f"Could not save profile for {endpoint}: {e}")
+            return None
+        _count('profiled')
+        print(f"Profiled {endpoint}: {sampler.samples} samples over {elapsed * 1000:.0f} ms -> {profile_id}")
+        return profile_id
+    finally:
+        _active.release()
+
+
+def _prune():
+    profiles = sorted((name for name in os.listdir(PROFILE_DIR) if PROFILE_ID.match(name)),
+                      key=lambda name: os.path.getmtime(os.path.join(PROFILE_DIR, name)))
+    for name in profiles[:max(len(profiles) - KEEP_PROFILES, 0)]:
+        try:
+            os.remove(os.path.join(PROFILE_DIR, name))
+        except OSError:
+            pass
+
+
+def read_profile(profile_id):
+    """Return a stored profile's text, or None if ``profile_id`` is unknown or malformed."""
+    if not PROFILE_ID.match(profile_id):
+        return None
+    try:
+        with open(os.path.join(PROFILE_DIR, profile_id)) as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def attach_profiler(app, thread_prefixes=(), exclude_endpoints=()):
+    """Profile requests to ``app`` that carry a valid X-Profile header."""
+    if not PROFILER_TOKEN:
+        return
+    if "gevent.monkey" in sys.modules and sys.modules["gevent.monkey"].is_module_patched("threading"):
+        # Greenlets share one OS thread, so their stacks are invisible to sys._current_frames().
+        print("Request profiling is not available with gevent workers.")
+        return
+    from flask import g, request
+
+    @app.before_request
+    def maybe_start_profile():
+        if request.endpoint in exclude_endpoints or not is_authorized(request.headers.get(PROFILE_HEADER)):
+            return
+        g.profiler, g.profiler_skipped = start_profile(thread_prefixes)
+
+    @app.after_request
+    def finish_request_profile(response):
+        sampler = g.pop("profiler", None)
+        if sampler is not None:
+            profile_id = finish_profile(sampler, request.endpoint or "unmatched")
+            if profile_id:
+                response.headers["X-Profile-Id"] = profile_id
+        elif g.get("profiler_skipped"):
+            response.headers["X-Profile-Skipped"] = g.profiler_skipped
+        return response
+
+    @app.teardown_request
+    def release_profile(exc):
+        # after_request does not run if the response could not be built.
+        sampler = g.pop("profiler", None)
+        if sampler is not None:
+            sampler.stop()
+            _active.release()
+
+
+def get_profiler_stats():
+    with _stats_lock:
+        stats = dict(_stats)
+    return dict(stats, enabled=bool(PROFILER_TOKEN), max_per_minute=MAX_PER_MINUTE)
@@ -0,0 +1,72 @@
+import base64
+import datetime
+import sqlalchemy
+
+# Reviews are paged newest-first with a (timestamp, id) keyset cursor. The
+# row-value comparison matches idx_reviews_destination_timestamp_id column for
+# column, so every page is a bounded range scan no matter how deep the client
+# pages. Per-destination totals live in review_stats and
+# are updated in the same transaction as each new review.
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 50
+RATINGS = (1, 2, 3, 4, 5)
+
+
+def encode_cursor(timestamp, review_id):
+    value = timestamp.isoformat() if hasattr(timestamp, 'isoformat') else str(timestamp)
+    return base64.urlsafe_b64encode(f"{value}|{review_id}".encode()).decode()
+
+
+def decode_cursor(cursor):
+    """Return ``(timestamp, id)`` for a cursor, raising ValueError if it is malformed."""
+    value, review_id = base64.urlsafe_b64decode(cursor.encode()).decode().rsplit('|', 1)
+    return datetime.datetime.fromisoformat(value), int(review_id)
+
+
+def fetch_review_page(conn, destination_id, limit=DEFAULT_PAGE_SIZE, cursor=None):
+    params = {'dest_id': destination_id, 'limit': limit + 1}
+    query_str = "SELECT * FROM reviews WHERE destination_id = :dest_id"
+    if cursor:
+        params['cursor_ts'], params['cursor_id'] = decode_cursor(cursor)
+        query_str += " AND (timestamp, id) < (:cursor_ts, :cursor_id)"
+    query_str += " ORDER BY timestamp DESC, id DESC LIMIT :limit"
+
+    rows = conn.execute(sqlalchemy.text(query_str), params).fetchall()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]._mapping
+        next_cursor = encode_cursor(last['timestamp'], last['id'])
+    return rows, next_cursor
+
+
+def _summary_from_row(row):
+    count = row['review_count'] if row else 0
+    return {
+        'count': count,
+        'average_rating': round(row['rating_sum'] / count, 2) if count else None,
+        'histogram': {str(rating): (row[f'rating_{rating}'] if row else 0) for rating in RATINGS},
+    }
+
+
+def fetch_review_summaries(conn, destination_ids):
+    """Return ``{destination_id: summary}`` for every requested id, including ones with no reviews."""
+    if not destination_ids:
+        return {}
+    query = sqlalchemy.text("SELECT * FROM review_stats WHERE destination_id IN :ids").bindparams(
+        sqlalchemy.bindparam('ids', expanding=True))
+    rows = {row._mapping['destination_id']: row._mapping for row in conn.execute(query, {'ids': list(destination_ids)})}
+    return {dest_id: _summary_from_row(rows.get(dest_id)) for dest_id in destination_ids}
+
+
+def record_review_stats(conn, destination_id, rating):
+    """Fold one new review into review_stats. ``rating`` must already be validated as 1-5."""
+    bucket = f"rating_{int(rating)}"
+    conn.execute(sqlalchemy.text(f"""
+        INSERT INTO review_stats (destination_id, review_count, rating_sum, {bucket})
+        VALUES (:dest_id, 1, :rating, 1)
+        ON CONFLICT (destination_id) DO UPDATE SET
+            review_count = review_stats.review_count + 1,
+            rating_sum = review_stats.rating_sum + :rating,
+            {bucket} = review_stats.{bucket} + 1
+    """), {'dest_id': destination_id, 'rating': int(rating)})
@@ -0,0 +1,75 @@
+import os
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# JSON encoding for responses. orjson is several times faster than the stdlib
+# encoder and writes bytes directly; JSON_SERIALIZER=stdlib (or orjson not
+# being installed) keeps Flask's own encoder. Output is equivalent either way:
+# keys stay sorted and dates still go through Flask's default handler, so
+# timestamps keep their HTTP-date format.
+JSON_SERIALIZER = os.environ.get("JSON_SERIALIZER", "auto").lower()
+USE_ORJSON = orjson is not None and JSON_SERIALIZER in ("auto", "orjson")
+if JSON_SERIALIZER == "orjson" and orjson is None:
+    print("JSON_SERIALIZER=orjson but orjson is not installed; using the stdlib encoder.")
+
+# Rows are flushed to the client in batches of this many array elements.
+STREAM_CHUNK_ROWS = int(os.environ.get("JSON_STREAM_CHUNK_ROWS", 64))
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes with orjson when it is available."""
+
+    def __init__(self, app, use_orjson=USE_ORJSON):
+        super().__init__(app)
+        self.use_orjson = use_orjson
+
+    def _orjson_options(self, indent=False):
+        options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            options |= orjson.OPT_SORT_KEYS
+        if indent:
+            options |= orjson.OPT_INDENT_2
+        return options
+
+    def dumps_bytes(self, obj, indent=False):
+        """Serialize ``obj`` to UTF-8 JSON bytes without an intermediate str."""
+        if self.use_orjson:
+            return orjson.dumps(obj, default=self.default, option=self._orjson_options(indent))
+        if indent:
+            return super().dumps(obj, indent=2).encode("utf-8")
+        return super().dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    def dumps(self, obj, **kwargs):
+        # orjson output is always compact, which covers Flask's own separators argument.
+        if self.use_orjson and set(kwargs) <= {"indent", "separators"}:
+            return self.dumps_bytes(obj, indent=bool(kwargs.get("indent"))).decode("utf-8")
+        return super().dumps(obj, **kwargs)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        return self._app.response_class(self.dumps_bytes(obj, indent=indent) + b"\n", mimetype=self.mimetype)
+
+
+def stream_json_array(fragments, chunk_rows=STREAM_CHUNK_ROWS):
+    """Yield a JSON array from already-encoded element ``fragments`` in batches.
+
+    ``fragments`` is consumed lazily, one batch at a time. It must not hold a
+    connection or other resource, since the response may be abandoned mid-way.
+    """
+    yield b"["
+    batch = []
+    first = True
+    for fragment in fragments:
+        batch.append(fragment)
+        if len(batch) >= chunk_rows:
+            yield (b"" if first else b",") + b",".join(batch)
+            first = False
+            batch = []
+    if batch:
+        yield (b"" if first else b",") + b",".join(batch)
+    yield b"]\n"
@@ -0,0 +1,40 @@
+class TagIndex:
+    """In-memory inverted index from tag to a bitmap of destination positions.
+
+    Destinations are numbered in load order; each tag (and each cost tier) maps
+    to a Python int whose set bits are the destinations carrying it, so a search
+    is a handful of bitwise ANDs/ORs instead of a LIKE scan over every row.
+    """
+
+    def __init__(self, rows):
+        self.tag_bitmaps = {}
+        self.cost_bitmaps = {}
+        for position, row in enumerate(rows):
+            bit = 1 << position
+            for tag in row['tags'].split(','):
+                tag = tag.strip().lower()
+                if tag:
+                    self.tag_bitmaps[tag] = self.tag_bitmaps.get(tag, 0) | bit
+            tier = row['cost_tier']
+            self.cost_bitmaps[tier] = self.cost_bitmaps.get(tier, 0) | bit
+
+    def match(self, trip_scope, traveler_type, budget='any', search_terms=()):
+        """Return the bitmap of destinations passing every filter."""
+        bitmap = self.tag_bitmaps.get(trip_scope, 0) & self.tag_bitmaps.get(traveler_type, 0)
+        if budget != 'any':
+            bitmap &= self.cost_bitmaps.get(budget, 0)
+        if search_terms:
+            any_term = 0
+            for term in search_terms:
+                any_term |= self.tag_bitmaps.get(term, 0)
+            bitmap &= any_term
+        return bitmap
+
+    @staticmethod
+    def positions(bitmap):
+        positions = []
+        while bitmap:
+            low_bit = bitmap & -bitmap
+            positions.append(low_bit.bit_length() - 1)
+            bitmap ^= low_bit
+        return positions
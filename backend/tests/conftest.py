@@ -0,0 +1,19 @@
+import os
+import sys
+import pytest
+import sqlalchemy
+
+# The backend is a flat set of modules run from this directory, so make them
+# importable the same way gunicorn and the scripts see them.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """A throwaway SQLite database with the full schema and migrations applied."""
+    from create_db import create_schema
+    engine = sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'travel.db'}")
+    with engine.begin() as conn:
+        create_schema(conn, 'sqlite')
+    yield engine
+    engine.dispose()
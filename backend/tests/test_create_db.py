@@ -0,0 +1,118 @@
+import csv
+import pytest
+import sqlalchemy
+import create_db
+from create_db import SEED_TABLES, diff_table, referenced_keys, rows_differ, upsert_rows
+
+DESTINATION_COLUMNS = SEED_TABLES[0][2]
+LANDMARK_COLUMNS = SEED_TABLES[1][2]
+
+GOA = {'id': 'goa001', 'name': 'Goa', 'city': 'Goa', 'country': 'India', 'description': 'Beaches.',
+       'tags': 'beach,party', 'lat': 15.345, 'lon': 74.08, 'cost_tier': 'mid-range'}
+JAIPUR = {'id': 'jai001', 'name': 'Jaipur', 'city': 'Jaipur', 'country': 'India', 'description': 'Forts.',
+          'tags': 'history,fort', 'lat': 26.9124, 'lon': 75.7873, 'cost_tier': 'budget'}
+UDAIPUR = {'id': 'udai001', 'name': 'Udaipur', 'city': 'Udaipur', 'country': 'India', 'description': '',
+           'tags': 'lake,palace', 'lat': 24.5854, 'lon': 73.7125, 'cost_tier': 'luxury'}
+BAGA = {'destination_id': 'goa001', 'name': 'Baga Beach', 'category': 'attraction', 'address': 'North Goa',
+        'lat': 15.5583, 'lon': 73.7518}
+FORT = {'destination_id': 'jai001', 'name': 'Amber Fort', 'category': 'attraction', 'address': '',
+        'lat': 26.9855, 'lon': 75.8513}
+
+
+@pytest.fixture
+def seed_dir(tmp_path, monkeypatch):
+    path = tmp_path / 'seed'
+    path.mkdir()
+    monkeypatch.setattr(create_db, 'SEED_DIR', str(path))
+    return path
+
+
+def write_seed(seed_dir, filename, columns, rows):
+    with open(seed_dir / filename, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=columns)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def sync(engine, table):
+    """Apply a seed file the way sync_catalogue does and return the diff it acted on."""
+    _, filename, columns, key = next(entry for entry in SEED_TABLES if entry[0] == table)
+    with engine.begin() as conn:
+        inserts, updates, delete_keys = diff_table(conn, table, filename, columns, key)
+        upsert_rows(conn, table, columns, key, inserts + updates)
+    return inserts, updates, delete_keys
+
+
+def stored(engine, table, columns):
+    with engine.connect() as conn:
+        return [dict(row._mapping) for row in conn.execute(sqlalchemy.text(
+            f"SELECT {', '.join(columns)} FROM {table} ORDER BY {', '.join(columns[:2])}"))]
+
+
+def test_rows_differ_tolerates_float_round_trips():
+    stored_row = dict(GOA, lat=15.345000267028809)  # 15.345 read back through float4
+    assert not rows_differ(GOA, stored_row, DESTINATION_COLUMNS)
+    assert rows_differ(GOA, dict(GOA, lat=15.35), DESTINATION_COLUMNS)
+    assert rows_differ(GOA, dict(GOA, tags='beach'), DESTINATION_COLUMNS)
+    assert rows_differ(dict(GOA, description=None), GOA, DESTINATION_COLUMNS)
+
+
+def test_first_sync_inserts_every_seed_row(engine, seed_dir):
+    write_seed(seed_dir, 'destinations.csv', DESTINATION_COLUMNS, [GOA, JAIPUR])
+
+    inserts, updates, delete_keys = sync(engine, 'destinations')
+
+    assert [row['id'] for row in inserts] == ['goa001', 'jai001']
+    assert updates == [] and delete_keys == []
+    assert stored(engine, 'destinations', DESTINATION_COLUMNS) == [GOA, JAIPUR]
+
+
+def test_sync_upserts_changes_and_reports_removed_rows(engine, seed_dir):
+    write_seed(seed_dir, 'destinations.csv', DESTINATION_COLUMNS, [GOA, JAIPUR])
+    sync(engine, 'destinations')
+
+    edited_goa = dict(GOA, description='Beaches and nightlife.', lat=15.4)
+    write_seed(seed_dir, 'destinations.csv', DESTINATION_COLUMNS, [edited_goa, UDAIPUR])
+    inserts, updates, delete_keys = sync(engine, 'destinations')
+
+    assert [row['id'] for row in inserts] == ['udai001']
+    assert [row['id'] for row in updates] == ['goa001']
+    assert delete_keys == [('jai001',)]
+    # Removed rows are only reported; deleting them is left to --prune.
+    assert stored(engine, 'destinations', DESTINATION_COLUMNS) == [
+        edited_goa, JAIPUR, dict(UDAIPUR, description=None)]
+
+
+def test_resync_of_unchanged_seed_is_a_no_op(engine, seed_dir):
+    write_seed(seed_dir, 'destinations.csv', DESTINATION_COLUMNS, [GOA, JAIPUR, UDAIPUR])
+    sync(engine, 'destinations')
+
+    assert sync(engine, 'destinations') == ([], [], [])
+
+
+def test_landmarks_match_on_destination_and_name(engine, seed_dir):
+    write_seed(seed_dir, 'landmarks.csv', LANDMARK_COLUMNS, [BAGA, FORT])
+    sync(engine, 'landmarks')
+
+    moved_fort = dict(FORT, address='Amer, Jaipur')
+    write_seed(seed_dir, 'landmarks.csv', LANDMARK_COLUMNS, [BAGA, moved_fort, dict(BAGA, destination_id='jai001')])
+    inserts, updates, delete_keys = sync(engine, 'landmarks')
+
+    assert [(row['destination_id'], row['name']) for row in inserts] == [('jai001', 'Baga Beach')]
+    assert [(row['destination_id'], row['name']) for row in updates] == [('jai001', 'Amber Fort')]
+    assert delete_keys == []
+    assert len(stored(engine, 'landmarks', LANDMARK_COLUMNS)) == 3
+
+
+def test_prune_keeps_destinations_users_reference(engine, seed_dir):
+    write_seed(seed_dir, 'destinations.csv', DESTINATION_COLUMNS, [GOA, JAIPUR, UDAIPUR])
+    sync(engine, 'destinations')
+    with engine.begin() as conn:
+        conn.execute(sqlalchemy.text("INSERT INTO saved_destinations (user_id, destination_id) VALUES (1, 'jai001')"))
+        conn.execute(sqlalchemy.text(
+            "INSERT INTO reviews (destination_id, user_id, username, rating) VALUES ('udai001', 1, 'tester', 5)"))
+
+    with engine.connect() as conn:
+        kept = referenced_keys(conn, 'destinations', [('goa001',), ('jai001',), ('udai001',)])
+        assert referenced_keys(conn, 'landmarks', [('goa001', 'Baga Beach')]) == set()
+    assert kept == {('jai001',), ('udai001',)}
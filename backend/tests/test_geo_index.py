@@ -0,0 +1,67 @@
+import math
+import random
+import pytest
+from geo_index import EARTH_RADIUS_KM, GridIndex, haversine_km
+
+
+class Point:
+    __slots__ = ('lat', 'lon')
+
+    def __init__(self, lat, lon):
+        self.lat, self.lon = lat, lon
+
+
+def brute_force(points, lat, lon, radius_km):
+    return sorted(id(point) for point in points if haversine_km(lat, lon, point.lat, point.lon) <= radius_km)
+
+
+def found(index, lat, lon, radius_km):
+    return sorted(id(point) for _, point in index.within(lat, lon, radius_km))
+
+
+def destination_point(lat, lon, distance_km, bearing):
+    """The point ``distance_km`` away from (lat, lon) along ``bearing`` radians."""
+    angle = distance_km / EARTH_RADIUS_KM
+    lat1, lon1 = math.radians(lat), math.radians(lon)
+    lat2 = math.asin(math.sin(lat1) * math.cos(angle) + math.cos(lat1) * math.sin(angle) * math.cos(bearing))
+    lon2 = lon1 + math.atan2(math.sin(bearing) * math.sin(angle) * math.cos(lat1),
+                             math.cos(angle) - math.sin(lat1) * math.sin(lat2))
+    return Point(math.degrees(lat2), (math.degrees(lon2) + 180) % 360 - 180)
+
+
+@pytest.mark.parametrize('cell_degrees', [0.5, 1.0, 5.0])
+def test_within_matches_brute_force(cell_degrees):
+    rng = random.Random(cell_degrees)
+    points = [Point(rng.uniform(-90, 90), rng.uniform(-180, 180)) for _ in range(1000)]
+    index = GridIndex(points, cell_degrees)
+    for _ in range(100):
+        # Bias queries towards the poles and the antimeridian, where the cell maths wraps.
+        lat = rng.choice([rng.uniform(-90, 90), rng.uniform(80, 90), rng.uniform(-90, -80)])
+        lon = rng.choice([rng.uniform(-180, 180), rng.uniform(175, 180), rng.uniform(-180, -175)])
+        radius_km = rng.choice([rng.uniform(1, 100), rng.uniform(100, 2000), rng.uniform(2000, 20000)])
+        assert found(index, lat, lon, radius_km) == brute_force(points, lat, lon, radius_km)
+
+
+def test_points_on_the_edge_of_the_circle_are_found():
+    rng = random.Random(7)
+    for _ in range(100):
+        lat, lon = rng.uniform(-85, 85), rng.uniform(-180, 180)
+        radius_km = rng.uniform(5, 3000)
+        ring = [destination_point(lat, lon, radius_km * rng.uniform(0.999, 0.9999), rng.uniform(0, 2 * math.pi))
+                for _ in range(50)]
+        assert found(GridIndex(ring), lat, lon, radius_km) == brute_force(ring, lat, lon, radius_km)
+
+
+def test_just_inside_the_radius_across_a_cell_boundary():
+    # Due north, 999.9 km away, and in the next row of cells from the query.
+    point = destination_point(0.01, 10.0, 999.9, 0.0)
+    assert [item for _, item in GridIndex([point]).within(0.01, 10.0, 1000)] == [point]
+
+
+def test_results_are_nearest_first_and_limited():
+    points = [Point(15.0 + i * 0.05, 74.0) for i in range(10)]
+    rng = random.Random(3)
+    rng.shuffle(points)
+    matches = GridIndex(points).within(15.0, 74.0, 100, limit=4)
+    assert [round(item.lat, 2) for _, item in matches] == [15.0, 15.05, 15.1, 15.15]
+    assert [distance for distance, _ in matches] == sorted(distance for distance, _ in matches)
@@ -0,0 +1,70 @@
+import datetime
+import pytest
+import sqlalchemy
+from reviews import decode_cursor, encode_cursor, fetch_review_page
+
+
+def add_reviews(engine, destination_id, count):
+    # Three reviews share every timestamp so paging has to break ties on id.
+    start = datetime.datetime(2024, 1, 1)
+    rows = [{'dest_id': destination_id, 'timestamp': (start + datetime.timedelta(minutes=i // 3)).strftime('%Y-%m-%d %H:%M:%S')}
+            for i in range(count)]
+    with engine.begin() as conn:
+        conn.execute(sqlalchemy.text("""
+            INSERT INTO reviews (destination_id, user_id, username, rating, comment, timestamp)
+            VALUES (:dest_id, 1, 'tester', 4, 'Nice', :timestamp)
+        """), rows)
+
+
+def test_cursor_round_trip():
+    timestamp = datetime.datetime(2024, 5, 17, 9, 30, 12, 250000)
+    assert decode_cursor(encode_cursor(timestamp, 42)) == (timestamp, 42)
+    assert decode_cursor(encode_cursor('2024-05-17 09:30:12', 7)) == (datetime.datetime(2024, 5, 17, 9, 30, 12), 7)
+
+
+@pytest.mark.parametrize('cursor', ['not-base64!', 'bm8tc2VwYXJhdG9y', encode_cursor('yesterday', 1),
+                                    encode_cursor('2024-01-01', 'x')])
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+def test_pages_cover_every_review_once_newest_first(engine):
+    add_reviews(engine, 'goa001', 57)
+    add_reviews(engine, 'jai001', 5)
+
+    with engine.connect() as conn:
+        expected = [(row.timestamp, row.id) for row in conn.execute(sqlalchemy.text(
+            "SELECT timestamp, id FROM reviews WHERE destination_id = 'goa001' ORDER BY timestamp DESC, id DESC"))]
+        seen, cursor, pages = [], None, 0
+        while True:
+            rows, cursor = fetch_review_page(conn, 'goa001', limit=10, cursor=cursor)
+            seen.extend((row.timestamp, row.id) for row in rows)
+            pages += 1
+            if cursor is None:
+                break
+
+    assert pages == 6
+    assert seen == expected
+
+
+def test_exact_final_page_has_no_next_cursor(engine):
+    add_reviews(engine, 'goa001', 20)
+    with engine.connect() as conn:
+        rows, cursor = fetch_review_page(conn, 'goa001', limit=10)
+        rows, cursor = fetch_review_page(conn, 'goa001', limit=10, cursor=cursor)
+    assert len(rows) == 10
+    assert cursor is None
+
+
+def test_deep_pages_are_a_range_scan(engine):
+    add_reviews(engine, 'goa001', 30)
+    with engine.connect() as conn:
+        _, cursor = fetch_review_page(conn, 'goa001', limit=10)
+        timestamp, review_id = decode_cursor(cursor)
+        plan = ' '.join(row[-1] for row in conn.execute(sqlalchemy.text(
+            "EXPLAIN QUERY PLAN SELECT * FROM reviews WHERE destination_id = :dest_id"
+            " AND (timestamp, id) < (:cursor_ts, :cursor_id) ORDER BY timestamp DESC, id DESC LIMIT 11"),
+            {'dest_id': 'goa001', 'cursor_ts': timestamp, 'cursor_id': review_id}))
+    assert 'idx_reviews_destination_timestamp_id (destination_id=? AND timestamp<?)' in plan
+    assert 'TEMP B-TREE' not in plan
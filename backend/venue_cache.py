@@ -0,0 +1,183 @@
+import os
+import json
+import time
+import sqlite3
+import threading
+import concurrent.futures
+import requests
+from cache import LRUCache
+from geoapify import request_venues
+
+# Geoapify results are cached per geo tile and category: an in-memory LRU in
+# front of a SQLite file shared by every worker on the host. Entries are fresh
+# for VENUE_CACHE_TTL, then served stale (while a background refresh runs) for
+# VENUE_CACHE_STALE_SECONDS more. Failures are cached briefly so an upstream
+# outage does not turn every city open into a retry storm, and concurrent
+# misses for the same tile share a single Geoapify call.
+TILE_DEGREES = float(os.environ.get("VENUE_CACHE_TILE_DEGREES", 0.05))
+CACHE_TTL = float(os.environ.get("VENUE_CACHE_TTL", 24 * 3600))
+STALE_SECONDS = float(os.environ.get("VENUE_CACHE_STALE_SECONDS", 7 * 24 * 3600))
+NEGATIVE_TTL = float(os.environ.get("VENUE_CACHE_NEGATIVE_TTL", 60))
+CACHE_PATH = os.environ.get("VENUE_CACHE_PATH", "venue_cache.db")
+
+_memory = LRUCache(maxsize=int(os.environ.get("VENUE_CACHE_SIZE", 2048)))
+_refresh_executor = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix="venue-cache")
+_refreshing = set()
+_refreshing_lock = threading.Lock()
+_inflight = {}
+_inflight_lock = threading.Lock()
+_stats = {'fresh_hits': 0, 'stale_hits': 0, 'negative_hits': 0, 'misses': 0, 'coalesced_misses': 0, 'refreshes': 0}
+_stats_lock = threading.Lock()
+_disk_ready = False
+
+
+def tile_for(lon, lat):
+    """Snap a coordinate to the centre of its cache tile."""
+    lon_index = int(float(lon) // TILE_DEGREES)
+    lat_index = int(float(lat) // TILE_DEGREES)
+    return lon_index, lat_index, round((lon_index + 0.5) * TILE_DEGREES, 6), round((lat_index + 0.5) * TILE_DEGREES, 6)
+
+
+def _count(name):
+    with _stats_lock:
+        _stats[name] += 1
+
+
+def _disk_connection():
+    global _disk_ready
+    conn = sqlite3.connect(CACHE_PATH, timeout=5)
+    if not _disk_ready:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute('''
+        CREATE TABLE IF NOT EXISTS venue_cache (
+            cache_key TEXT PRIMARY KEY, venues TEXT, ok INTEGER NOT NULL, fetched_at REAL NOT NULL
+        )''')
+        conn.commit()
+        _disk_ready = True
+    return conn
+
+
+def _load_from_disk(key):
+    try:
+        conn = _disk_connection()
+        try:
+            row = conn.execute("SELECT venues, ok, fetched_at FROM venue_cache WHERE cache_key = ?", (key,)).fetchone()
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        print(f"Venue cache read failed: {e}")
+        return None
+    if row is None:
+        return None
+    return (json.loads(row[0]) if row[0] else [], bool(row[1]), row[2])
+
+
+def _store(key, venues, ok):
+    entry = (venues, ok, time.time())
+    _memory.set(key, entry)
+    try:
+        conn = _disk_connection()
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO venue_cache (cache_key, venues, ok, fetched_at) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(venues), int(ok), entry[2]))
+            conn.commit()
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        print(f"Venue cache write failed: {e}")
+    return entry
+
+
+def _fetch_and_store(key, lon, lat, categories, limit):
+    try:
+        venues = request_venues(lon, lat, categories, limit)
+    except requests.exceptions.RequestException as e:
+        print(f"API call to Geoapify failed after retries: {e}")
+        return _store(key, [], False)
+    return _store(key, venues, True)
+
+
+def _fetch_once(key, lon, lat, categories, limit):
+    """Fetch ``key`` on this thread, or wait for the request already fetching it."""
+    with _inflight_lock:
+        future = _inflight.get(key)
+        leader = future is None
+        if leader:
+            future = _inflight[key] = concurrent.futures.Future()
+    if not leader:
+        _count('coalesced_misses')
+        return future.result()
+
+    _count('misses')
+    try:
+        entry = _fetch_and_store(key, lon, lat, categories, limit)
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(entry)
+        return entry
+    finally:
+        with _inflight_lock:
+            del _inflight[key]
+
+
+def _refresh_in_background(key, lon, lat, categories, limit):
+    with _refreshing_lock:
+        if key in _refreshing:
+            return
+        _refreshing.add(key)
+    _count('refreshes')
+
+    def refresh():
+        try:
+            _store(key, request_venues(lon, lat, categories, limit), True)
+        except requests.exceptions.RequestException as e:
+            # Keep serving the last good answer until it falls out of the stale window.
+            print(f"Background refresh of {key} failed: {e}")
+        finally:
+            with _refreshing_lock:
+                _refreshing.discard(key)
+
+    _refresh_executor.submit(refresh)
+
+
+def get_cached_venues(lon, lat, categories, limit=10):
+    """Geoapify venues near a point, via geoapify.request_venues and the tile cache.
+
+    Failed lookups return ``[]``. Returns fresh dicts callers may modify.
+    """
+    lon_index, lat_index, tile_lon, tile_lat = tile_for(lon, lat)
+    key = f"{categories}:{limit}:{TILE_DEGREES}:{lon_index}:{lat_index}"
+
+    entry = _memory.get(key)
+    if entry is None:
+        entry = _load_from_disk(key)
+        if entry is not None:
+            _memory.set(key, entry)
+
+    if entry is not None:
+        venues, ok, fetched_at = entry
+        age = time.time() - fetched_at
+        if not ok and age < NEGATIVE_TTL:
+            _count('negative_hits')
+            return []
+        if ok and age < CACHE_TTL:
+            _count('fresh_hits')
+            return [dict(venue) for venue in venues]
+        if ok and age < CACHE_TTL + STALE_SECONDS:
+            _count('stale_hits')
+            _refresh_in_background(key, tile_lon, tile_lat, categories, limit)
+            return [dict(venue) for venue in venues]
+
+    venues, ok, fetched_at = _fetch_once(key, tile_lon, tile_lat, categories, limit)
+    return [dict(venue) for venue in venues]
+
+
+def get_venue_cache_stats():
+    with _stats_lock:
+        stats = dict(_stats)
+    stats['memory'] = _memory.stats()
+    stats['tile_degrees'] = TILE_DEGREES
+    return stats
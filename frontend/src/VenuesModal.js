@@ -25,6 +25,8 @@ const StarRating = ({ rating, setRating }) => {
 const VenuesModal = ({ city, onClose, isDarkMode }) => {
     const [venues, setVenues] = useState({ attractions: [], restaurants: [] });
     const [reviews, setReviews] = useState([]);
+    const [reviewSummary, setReviewSummary] = useState({ count: 0, average_rating: null });
+    const [nextReviewsCursor, setNextReviewsCursor] = useState(null);
     const [isLoading, setIsLoading] = useState(true);
     const [selectedVenue, setSelectedVenue] = useState(null);
     const [isExpanded, setIsExpanded] = useState(false); // Re-introducing this state for the animation
@@ -47,7 +49,9 @@ const VenuesModal = ({ city, onClose, isDarkMode }) => {
 
             const reviewsResponse = await fetch(`https://escape-genie.onrender.com/api/reviews/${city.id}`);
             const reviewsData = await reviewsResponse.json();
-            setReviews(reviewsData || []);
+            setReviews(reviewsData.reviews || []);
+            setReviewSummary(reviewsData.summary || { count: 0, average_rating: null });
+            setNextReviewsCursor(reviewsData.next_cursor || null);
 
         } catch (error) {
             console.error("Failed to fetch data:", error);
@@ -60,6 +64,18 @@ const VenuesModal = ({ city, onClose, isDarkMode }) => {
         fetchVenuesAndReviews();
     }, [fetchVenuesAndReviews]);
 
+    const loadMoreReviews = async () => {
+        if (!nextReviewsCursor) return;
+        try {
+            const response = await fetch(`https://escape-genie.onrender.com/api/reviews/${city.id}?cursor=${encodeURIComponent(nextReviewsCursor)}`);
+            const data = await response.json();
+            setReviews(prevReviews => [...prevReviews, ...(data.reviews || [])]);
+            setNextReviewsCursor(data.next_cursor || null);
+        } catch (error) {
+            console.error("Failed to fetch more reviews:", error);
+        }
+    };
+
     const handleReviewSubmit = async (e) => {
         e.preventDefault();
         if (userRating === 0) {
@@ -128,8 +144,8 @@ const VenuesModal = ({ city, onClose, isDarkMode }) => {
         ));
     };
 
-    const averageRating = reviews.length > 0
-        ? (reviews.reduce((acc, review) => acc + review.rating, 0) / reviews.length).toFixed(1)
+    const averageRating = reviewSummary.count > 0
+        ? reviewSummary.average_rating.toFixed(1)
         : 'No ratings yet';
 
     return (
@@ -140,7 +156,7 @@ const VenuesModal = ({ city, onClose, isDarkMode }) => {
                   <h2>{city.name}</h2>
                   <div className="modal-header-rating">
                       <span className="avg-rating-stars">{'★'.repeat(Math.round(averageRating))}{'☆'.repeat(5 - Math.round(averageRating))}</span>
-                      <span className="avg-rating-text">{averageRating} ({reviews.length} reviews)</span>
+                      <span className="avg-rating-text">{averageRating} ({reviewSummary.count} reviews)</span>
                   </div>
                 </div>
                 <button className="modal-close-button" onClick={onClose}>×</button>
@@ -191,6 +207,11 @@ const VenuesModal = ({ city, onClose, isDarkMode }) => {
                               ) : (
                                   <p>No reviews yet. Be the first!</p>
                               )}
+                              {nextReviewsCursor && (
+                                  <button type="button" className="load-more-reviews" onClick={loadMoreReviews}>
+                                      Show more reviews
+                                  </button>
+                              )}
                             </div>
                         </div>
 